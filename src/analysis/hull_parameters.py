@@ -18,7 +18,6 @@ References:
 
 from typing import Optional
 from src.geometry.hull import Hull
-from src.geometry.profile import Profile
 
 
 def calculate_draft(hull: Hull, waterline: Optional[float] = None) -> float:
@@ -85,59 +84,7 @@ def calculate_waterplane_area(
             "Ensure waterline is calculated before calling calculate_waterplane_area()."
         )
 
-    x = hull.min_x
-    half_beams = []  # Half-beam at each station (centerline to max y)
-    stations = []
-
-    # Calculate half-beam at waterline for each station
-    while x <= hull.max_x:
-        points = []
-        for curve in hull.curves:
-            try:
-                point = curve.eval_x(x)
-                points.append(point)
-            except ValueError:
-                continue
-
-        if len(points) >= 3:
-            # Find y-coordinates where hull intersects waterline
-            waterline_y_coords = []
-            n = len(points)
-
-            for i in range(n):
-                p1 = points[i]
-                p2 = points[(i + 1) % n]
-
-                # If point is at waterline, add it
-                if abs(p1.z - waterline) < 1e-6:
-                    waterline_y_coords.append(abs(p1.y))
-
-                # If edge crosses waterline, interpolate
-                if (p1.z < waterline < p2.z) or (p2.z < waterline < p1.z):
-                    t = (waterline - p1.z) / (p2.z - p1.z)
-                    intersect_y = p1.y + t * (p2.y - p1.y)
-                    waterline_y_coords.append(abs(intersect_y))
-
-            if waterline_y_coords:
-                # Half-beam is maximum y-coordinate at this station
-                half_beam = max(waterline_y_coords)
-                half_beams.append(half_beam)
-                stations.append(x)
-
-        x += step
-
-    if len(half_beams) < 2:
-        return 0.0
-
-    # Integrate half-beam along length, then double for full waterplane area
-    # Awp = 2 * ∫ half_beam(x) dx  (factor of 2 for port and starboard)
-    area = 0.0
-    for i in range(len(half_beams) - 1):
-        avg_half_beam = (half_beams[i] + half_beams[i + 1]) / 2.0
-        dx = stations[i + 1] - stations[i]
-        area += avg_half_beam * dx
-
-    return 2.0 * area  # Double for full waterplane (port + starboard)
+    return hull.waterplane_area(waterline, step)
 
 
 def calculate_max_section_area(
@@ -171,31 +118,7 @@ def calculate_max_section_area(
             "Ensure waterline is calculated before calling calculate_max_section_area()."
         )
 
-    x = hull.min_x
-    max_area = 0.0
-
-    # Find maximum cross-section area along the hull
-    while x <= hull.max_x:
-        points = []
-        for curve in hull.curves:
-            try:
-                point = curve.eval_x(x)
-                points.append(point)
-            except ValueError:
-                continue
-
-        if len(points) >= 3:
-            # Get points below waterline
-            points_below = hull._get_points_below_waterline(points, waterline)
-            profile = Profile(x, points_below)
-
-            if profile.is_valid():
-                area = profile.calculate_area()
-                max_area = max(max_area, area)
-
-        x += step
-
-    return max_area
+    return hull.max_section_area(waterline, step)
 
 
 def calculate_block_coefficient(
@@ -23,9 +23,13 @@ References:
 """
 
 import math
+from functools import lru_cache
 from typing import List, Optional
 from dataclasses import dataclass
 
+import numpy as np
+from numpy.typing import ArrayLike
+
 # Physical constants
 WATER_DENSITY_FRESH = 1000.0  # kg/m³ - fresh water
 WATER_DENSITY_SALT = 1025.0  # kg/m³ - salt water
@@ -67,8 +71,8 @@ class ResistanceResult:
 
 
 def calculate_reynolds_number(
-    speed: float, waterline_length: float, kinematic_viscosity: float = KINEMATIC_VISCOSITY
-) -> float:
+    speed: ArrayLike, waterline_length: float, kinematic_viscosity: float = KINEMATIC_VISCOSITY
+) -> float | np.ndarray:
     """Calculate Reynolds number for flow along the hull.
 
     Reynolds number characterizes the flow regime (laminar vs. turbulent).
@@ -77,12 +81,12 @@ def calculate_reynolds_number(
     Formula: Re = (V × Lwl) / ν
 
     Args:
-        speed: Boat speed in m/s
+        speed: Boat speed in m/s (scalar or array of speeds)
         waterline_length: Waterline length (Lwl) in meters
         kinematic_viscosity: Kinematic viscosity of water in m²/s (default: 1.19e-6 at 15°C)
 
     Returns:
-        float: Reynolds number (dimensionless)
+        float | np.ndarray: Reynolds number (dimensionless), same shape as speed
 
     Raises:
         ValueError: If speed, waterline_length, or kinematic_viscosity are <= 0
@@ -91,19 +95,20 @@ def calculate_reynolds_number(
         >>> calculate_reynolds_number(speed=2.0, waterline_length=5.0)
         8403361.344537815  # Turbulent flow
     """
-    if speed < 0:
+    v = np.asarray(speed, dtype=float)
+    if np.any(v < 0):
         raise ValueError(f"Speed must be non-negative, got {speed}")
     if waterline_length <= 0:
         raise ValueError(f"Waterline length must be positive, got {waterline_length}")
     if kinematic_viscosity <= 0:
         raise ValueError(f"Kinematic viscosity must be positive, got {kinematic_viscosity}")
 
-    return (speed * waterline_length) / kinematic_viscosity
+    return (v * waterline_length) / kinematic_viscosity
 
 
 def calculate_froude_number(
-    speed: float, waterline_length: float, gravity: float = GRAVITY
-) -> float:
+    speed: ArrayLike, waterline_length: float, gravity: float = GRAVITY
+) -> float | np.ndarray:
     """Calculate Froude number, the dimensionless speed parameter.
 
     Froude number characterizes the wave-making regime:
@@ -114,12 +119,12 @@ def calculate_froude_number(
     Formula: Fn = V / sqrt(g × Lwl)
 
     Args:
-        speed: Boat speed in m/s
+        speed: Boat speed in m/s (scalar or array of speeds)
         waterline_length: Waterline length (Lwl) in meters
         gravity: Gravitational acceleration in m/s² (default: 9.81)
 
     Returns:
-        float: Froude number (dimensionless)
+        float | np.ndarray: Froude number (dimensionless), same shape as speed
 
     Raises:
         ValueError: If speed is negative or waterline_length or gravity are <= 0
@@ -128,16 +133,18 @@ def calculate_froude_number(
         >>> calculate_froude_number(speed=2.0, waterline_length=5.0)
         0.2857  # Low wave resistance regime
     """
-    if speed < 0:
+    v = np.asarray(speed, dtype=float)
+    if np.any(v < 0):
         raise ValueError(f"Speed must be non-negative, got {speed}")
     if waterline_length <= 0:
         raise ValueError(f"Waterline length must be positive, got {waterline_length}")
     if gravity <= 0:
         raise ValueError(f"Gravity must be positive, got {gravity}")
 
-    return speed / math.sqrt(gravity * waterline_length)
+    return v / np.sqrt(gravity * waterline_length)
 
 
+@lru_cache(maxsize=128)
 def calculate_hull_speed(waterline_length: float, gravity: float = GRAVITY) -> float:
     """Calculate theoretical hull speed (speed at Fn ≈ 0.40).
 
@@ -159,6 +166,10 @@ def calculate_hull_speed(waterline_length: float, gravity: float = GRAVITY) -> f
     Raises:
         ValueError: If waterline_length or gravity are <= 0
 
+    Note:
+        Results are memoized per (waterline_length, gravity) pair, since the same hull
+        is typically evaluated many times during interactive analysis.
+
     Example:
         >>> calculate_hull_speed(5.0)
         2.8014  # m/s ≈ 10.1 km/h
@@ -173,8 +184,8 @@ def calculate_hull_speed(waterline_length: float, gravity: float = GRAVITY) -> f
 
 
 def calculate_ittc_friction_coefficient(
-    reynolds_number: float, roughness_allowance: float = DEFAULT_ROUGHNESS_ALLOWANCE
-) -> float:
+    reynolds_number: ArrayLike, roughness_allowance: float = DEFAULT_ROUGHNESS_ALLOWANCE
+) -> float | np.ndarray:
     """Calculate ITTC 1957 frictional resistance coefficient.
 
     The ITTC (International Towing Tank Conference) 1957 friction line is the
@@ -185,7 +196,8 @@ def calculate_ittc_friction_coefficient(
     where ΔCf is a roughness allowance for surface finish.
 
     Args:
-        reynolds_number: Reynolds number (dimensionless, typically > 10^6 for kayaks)
+        reynolds_number: Reynolds number (dimensionless, typically > 10^6 for kayaks),
+                         scalar or array
         roughness_allowance: Additional coefficient for surface roughness (default: 0.0004)
                            Typical values:
                            - 0.0004: Kayak hulls (gelcoat, thermoformed plastic, composite)
@@ -193,7 +205,8 @@ def calculate_ittc_friction_coefficient(
                            - 0.0006: Rougher surfaces
 
     Returns:
-        float: Frictional resistance coefficient Cf (dimensionless)
+        float | np.ndarray: Frictional resistance coefficient Cf (dimensionless),
+                            same shape as reynolds_number
 
     Raises:
         ValueError: If reynolds_number <= 0 or roughness_allowance < 0
@@ -202,27 +215,35 @@ def calculate_ittc_friction_coefficient(
         >>> calculate_ittc_friction_coefficient(8.4e6)
         0.00288
     """
-    if reynolds_number <= 0:
+    re = np.asarray(reynolds_number, dtype=float)
+    if np.any(re <= 0):
         raise ValueError(f"Reynolds number must be positive, got {reynolds_number}")
     if roughness_allowance < 0:
         raise ValueError(f"Roughness allowance must be non-negative, got {roughness_allowance}")
 
+    return _ittc_cf(re, roughness_allowance)
+
+
+def _ittc_cf(reynolds_number: np.ndarray, roughness_allowance: float) -> np.ndarray:
+    """ITTC 1957 friction line plus roughness allowance, without input checks.
+
+    Shared by calculate_ittc_friction_coefficient() and the resistance curve kernel,
+    which validates its inputs once up front.
+    """
     # ITTC 1957 friction line
-    log_re = math.log10(reynolds_number)
+    log_re = np.log10(reynolds_number)
     cf_smooth = 0.075 / ((log_re - 2) ** 2)
 
     # Add roughness allowance
-    cf_total = cf_smooth + roughness_allowance
-
-    return cf_total
+    return cf_smooth + roughness_allowance
 
 
 def calculate_frictional_resistance(
-    speed: float,
+    speed: ArrayLike,
     wetted_surface: float,
-    friction_coefficient: float,
+    friction_coefficient: ArrayLike,
     water_density: float = WATER_DENSITY_FRESH,
-) -> float:
+) -> float | np.ndarray:
     """Calculate frictional resistance force.
 
     Frictional resistance is the viscous drag on the wetted surface of the hull.
@@ -231,13 +252,13 @@ def calculate_frictional_resistance(
     Formula: Rf = 0.5 × ρ × V² × Sw × Cf
 
     Args:
-        speed: Boat speed in m/s
+        speed: Boat speed in m/s (scalar or array of speeds)
         wetted_surface: Wetted surface area in m²
-        friction_coefficient: ITTC frictional resistance coefficient (Cf)
+        friction_coefficient: ITTC frictional resistance coefficient (Cf), scalar or array matching speed
         water_density: Water density in kg/m³ (default: 1000 for fresh water)
 
     Returns:
-        float: Frictional resistance in Newtons
+        float | np.ndarray: Frictional resistance in Newtons, same shape as speed
 
     Raises:
         ValueError: If any parameter is negative or water_density/wetted_surface are zero
@@ -246,22 +267,35 @@ def calculate_frictional_resistance(
         >>> calculate_frictional_resistance(speed=2.0, wetted_surface=2.5, friction_coefficient=0.003)
         15.0  # Newtons
     """
-    if speed < 0:
+    v = np.asarray(speed, dtype=float)
+    coefficient = np.asarray(friction_coefficient, dtype=float)
+    if np.any(v < 0):
         raise ValueError(f"Speed must be non-negative, got {speed}")
     if wetted_surface <= 0:
         raise ValueError(f"Wetted surface must be positive, got {wetted_surface}")
-    if friction_coefficient < 0:
+    if np.any(coefficient < 0):
         raise ValueError(f"Friction coefficient must be non-negative, got {friction_coefficient}")
     if water_density <= 0:
         raise ValueError(f"Water density must be positive, got {water_density}")
 
     # Rf = 0.5 × ρ × V² × Sw × Cf
-    return 0.5 * water_density * (speed**2) * wetted_surface * friction_coefficient
+    return (0.5 * water_density * wetted_surface) * (v * v) * coefficient
+
+
+@lru_cache(maxsize=128)
+def _cp_factor(prismatic_coefficient: float) -> float:
+    """Return the residuary coefficient scale factor for a given prismatic coefficient.
+
+    Fuller hulls (higher Cp) have higher wave resistance. Typical kayak Cp ≈ 0.50-0.60,
+    so 0.55 is used as the reference and Cr is scaled linearly around it.
+    """
+    cp_reference = 0.55
+    return 1.0 + 0.5 * (prismatic_coefficient - cp_reference)
 
 
 def calculate_residuary_coefficient(
-    froude_number: float, prismatic_coefficient: Optional[float] = None
-) -> float:
+    froude_number: ArrayLike, prismatic_coefficient: Optional[float] = None
+) -> float | np.ndarray:
     """Calculate residuary (wave-making) resistance coefficient.
 
     This uses an empirical model suitable for slender displacement hulls like kayaks.
@@ -276,13 +310,14 @@ def calculate_residuary_coefficient(
     - Fn > 0.40: Cr increases rapidly (exponential growth)
 
     Args:
-        froude_number: Froude number (Fn = V / sqrt(g × Lwl))
+        froude_number: Froude number (Fn = V / sqrt(g × Lwl)), scalar or array
         prismatic_coefficient: Prismatic coefficient (Cp), optional.
                              If provided, adjusts Cr based on hull fullness.
                              Higher Cp (fuller hull) → higher wave resistance.
 
     Returns:
-        float: Residuary resistance coefficient Cr (dimensionless)
+        float | np.ndarray: Residuary resistance coefficient Cr (dimensionless),
+                            same shape as froude_number
 
     Example:
         >>> calculate_residuary_coefficient(0.25)
@@ -292,43 +327,49 @@ def calculate_residuary_coefficient(
         >>> calculate_residuary_coefficient(0.50)
         0.0025   # High wave resistance
     """
+    return _cr(np.asarray(froude_number, dtype=float), prismatic_coefficient)[()]
+
+
+def _cr(froude_number: np.ndarray, prismatic_coefficient: Optional[float]) -> np.ndarray:
+    """Piecewise residuary coefficient model, without converting the input.
+
+    Shared by calculate_residuary_coefficient() and the resistance curve kernel.
+    """
     # Base empirical model for slender displacement hulls
     # This is a simplified model based on published kayak/canoe resistance data
 
-    if froude_number < 0.0:
-        froude_number = 0.0  # Handle edge case
-
-    if froude_number < 0.30:
-        # Very low wave resistance below Fn = 0.30
-        cr_base = 0.0001 * (froude_number**2)
-    elif froude_number < 0.40:
-        # Moderate increase between Fn = 0.30 and 0.40
-        # Linear interpolation in this range
-        fn_normalized = (froude_number - 0.30) / 0.10  # 0 to 1 in this range
-        cr_base = 0.00009 + fn_normalized * 0.0007
-    else:
+    fn = np.maximum(froude_number, 0.0)  # Handle edge case
+
+    excess_fn = fn - 0.40
+    cr_base = np.select(
+        [fn < 0.30, fn < 0.40],
+        [
+            # Very low wave resistance below Fn = 0.30
+            0.0001 * (fn**2),
+            # Moderate increase between Fn = 0.30 and 0.40
+            # Linear interpolation in this range (0 to 1 in this range)
+            0.00009 + (fn - 0.30) / 0.10 * 0.0007,
+        ],
         # Rapid exponential increase above Fn = 0.40 (hull speed region)
-        excess_fn = froude_number - 0.40
-        cr_base = 0.00079 + 0.003 * (excess_fn**2) + 0.01 * (excess_fn**3)
+        # Horner form of 0.00079 + 0.003·e² + 0.01·e³
+        0.00079 + excess_fn * excess_fn * (0.003 + 0.01 * excess_fn),
+    )
 
     # Adjust for prismatic coefficient if provided
     if prismatic_coefficient is not None:
-        # Fuller hulls (higher Cp) have higher wave resistance
-        # Typical kayak Cp ≈ 0.50-0.60
-        # Use 0.55 as reference; scale Cr accordingly
-        cp_reference = 0.55
-        cp_factor = 1.0 + 0.5 * (prismatic_coefficient - cp_reference)
-        cr_base *= cp_factor
+        cr_base = cr_base * _cp_factor(prismatic_coefficient)
 
-    return max(0.0, cr_base)  # Ensure non-negative
+    # Every branch is non-negative for Fn >= 0, and the Cp factor stays positive for any
+    # realistic hull (0.875 at Cp = 0.3), so no clamp is needed here.
+    return cr_base
 
 
 def calculate_residuary_resistance(
-    speed: float,
+    speed: ArrayLike,
     wetted_surface: float,
-    residuary_coefficient: float,
+    residuary_coefficient: ArrayLike,
     water_density: float = WATER_DENSITY_FRESH,
-) -> float:
+) -> float | np.ndarray:
     """Calculate residuary (wave-making + pressure) resistance.
 
     Residuary resistance includes wave-making drag and form drag (pressure resistance).
@@ -341,13 +382,13 @@ def calculate_residuary_resistance(
     in empirical models and simplifies the total resistance calculation.
 
     Args:
-        speed: Boat speed in m/s
+        speed: Boat speed in m/s (scalar or array of speeds)
         wetted_surface: Wetted surface area in m²
-        residuary_coefficient: Residuary resistance coefficient (Cr)
+        residuary_coefficient: Residuary resistance coefficient (Cr), scalar or array matching speed
         water_density: Water density in kg/m³ (default: 1000 for fresh water)
 
     Returns:
-        float: Residuary resistance in Newtons
+        float | np.ndarray: Residuary resistance in Newtons, same shape as speed
 
     Raises:
         ValueError: If any parameter is negative or water_density/wetted_surface are zero
@@ -356,17 +397,19 @@ def calculate_residuary_resistance(
         >>> calculate_residuary_resistance(speed=2.0, wetted_surface=2.5, residuary_coefficient=0.0005)
         2.5  # Newtons
     """
-    if speed < 0:
+    v = np.asarray(speed, dtype=float)
+    coefficient = np.asarray(residuary_coefficient, dtype=float)
+    if np.any(v < 0):
         raise ValueError(f"Speed must be non-negative, got {speed}")
     if wetted_surface <= 0:
         raise ValueError(f"Wetted surface must be positive, got {wetted_surface}")
-    if residuary_coefficient < 0:
+    if np.any(coefficient < 0):
         raise ValueError(f"Residuary coefficient must be non-negative, got {residuary_coefficient}")
     if water_density <= 0:
         raise ValueError(f"Water density must be positive, got {water_density}")
 
     # Rr = 0.5 × ρ × V² × Sw × Cr
-    return 0.5 * water_density * (speed**2) * wetted_surface * residuary_coefficient
+    return (0.5 * water_density * wetted_surface) * (v * v) * coefficient
 
 
 def calculate_effective_power(resistance: float, speed: float) -> float:
@@ -522,6 +565,96 @@ def calculate_resistance(
     )
 
 
+def _validate_curve_inputs(
+    speeds: np.ndarray,
+    waterline_length: float,
+    wetted_surface: float,
+    water_density: float,
+    kinematic_viscosity: float,
+    roughness_allowance: float,
+    propulsion_efficiency: float,
+) -> None:
+    """Validate all resistance curve inputs once, before the vectorized kernel runs.
+
+    Raises:
+        ValueError: On the first invalid input, with the same messages as the
+                    scalar helpers
+    """
+    if np.any(speeds < 0):
+        raise ValueError(f"Speed must be non-negative, got {speeds[speeds < 0][0]}")
+    if waterline_length <= 0:
+        raise ValueError(f"Waterline length must be positive, got {waterline_length}")
+    if wetted_surface <= 0:
+        raise ValueError(f"Wetted surface must be positive, got {wetted_surface}")
+    if water_density <= 0:
+        raise ValueError(f"Water density must be positive, got {water_density}")
+    if kinematic_viscosity <= 0:
+        raise ValueError(f"Kinematic viscosity must be positive, got {kinematic_viscosity}")
+    if roughness_allowance < 0:
+        raise ValueError(f"Roughness allowance must be non-negative, got {roughness_allowance}")
+    if propulsion_efficiency <= 0 or propulsion_efficiency > 1:
+        raise ValueError(
+            f"Propulsion efficiency must be in range (0, 1], got {propulsion_efficiency}"
+        )
+
+
+def _resistance_curve_arrays(
+    speeds: np.ndarray,
+    waterline_length: float,
+    wetted_surface: float,
+    prismatic_coefficient: Optional[float],
+    water_density: float,
+    kinematic_viscosity: float,
+    roughness_allowance: float,
+    propulsion_efficiency: float,
+) -> dict[str, np.ndarray]:
+    """Evaluate the resistance model over an array of speeds in one vectorized pass.
+
+    Mirrors calculate_resistance() element-wise: zero speeds produce all-zero
+    coefficients, resistances and powers. Inputs are assumed to have been checked
+    with _validate_curve_inputs() beforehand.
+
+    Returns:
+        dict mapping each ResistanceResult field name to an array shaped like speeds
+    """
+    # Fold everything that depends only on the hull and water parameters into per-curve
+    # scalars, so each speed point costs a single multiply per quantity
+    reynolds_per_speed = waterline_length / kinematic_viscosity
+    froude_per_speed = 1.0 / math.sqrt(GRAVITY * waterline_length)
+    pressure_factor = 0.5 * water_density * wetted_surface
+    power_factor = 1.0 / propulsion_efficiency
+
+    reynolds = speeds * reynolds_per_speed
+    froude = speeds * froude_per_speed
+    moving = speeds > 0
+
+    # Same coefficient cores as calculate_resistance(), unchecked since the inputs were
+    # validated once. Zero speed has no friction line (Re = 0), so Cf is evaluated on a
+    # dummy Re there and masked, like Cr.
+    cf = np.where(moving, _ittc_cf(np.where(moving, reynolds, 1.0), roughness_allowance), 0.0)
+    cr = np.where(moving, _cr(froude, prismatic_coefficient), 0.0)
+
+    dynamic_pressure = pressure_factor * (speeds * speeds)
+    rf = dynamic_pressure * cf
+    rr = dynamic_pressure * cr
+    rt = rf + rr
+    pe = rt * speeds
+    pp = pe * power_factor
+
+    return {
+        "speed": speeds,
+        "froude_number": froude,
+        "reynolds_number": reynolds,
+        "friction_coefficient": cf,
+        "residuary_coefficient": cr,
+        "frictional_resistance": rf,
+        "residuary_resistance": rr,
+        "total_resistance": rt,
+        "effective_power": pe,
+        "paddler_power": pp,
+    }
+
+
 def calculate_resistance_curve(
     speed_range: List[float],
     waterline_length: float,
@@ -535,7 +668,8 @@ def calculate_resistance_curve(
     """Calculate resistance curve over a range of speeds.
 
     This function computes resistance and performance data at multiple speeds,
-    suitable for generating resistance/power curves for visualization.
+    suitable for generating resistance/power curves for visualization. The whole
+    speed range is evaluated in a single vectorized pass rather than speed by speed.
 
     Args:
         speed_range: List of speeds in m/s to evaluate
@@ -561,21 +695,72 @@ def calculate_resistance_curve(
         ... )
         >>> # Plot resistance vs speed, power vs speed, etc.
     """
-    results = []
-    for speed in speed_range:
-        result = calculate_resistance(
-            speed=speed,
-            waterline_length=waterline_length,
-            wetted_surface=wetted_surface,
-            prismatic_coefficient=prismatic_coefficient,
-            water_density=water_density,
-            kinematic_viscosity=kinematic_viscosity,
-            roughness_allowance=roughness_allowance,
-            propulsion_efficiency=propulsion_efficiency,
+    speeds = np.asarray(speed_range, dtype=float)
+    if speeds.size == 0:
+        return []
+
+    _validate_curve_inputs(
+        speeds,
+        waterline_length,
+        wetted_surface,
+        water_density,
+        kinematic_viscosity,
+        roughness_allowance,
+        propulsion_efficiency,
+    )
+    curve = _resistance_curve_arrays(
+        speeds,
+        waterline_length,
+        wetted_surface,
+        prismatic_coefficient,
+        water_density,
+        kinematic_viscosity,
+        roughness_allowance,
+        propulsion_efficiency,
+    )
+
+    columns = [curve[name].tolist() for name in ResistanceResult.__dataclass_fields__]
+    return [ResistanceResult(*row) for row in zip(*columns)]
+
+
+def calculate_cruise_speed_for_power(
+    target_power: ArrayLike, speeds: ArrayLike, paddler_power: ArrayLike
+) -> float | np.ndarray:
+    """Find the speed a paddler can sustain for a given power output.
+
+    Inverts a precomputed resistance curve by linear interpolation, so a "target
+    power" query costs a single np.interp call instead of a search over the curve.
+    Paddler power must increase monotonically with speed, which holds for the
+    displacement regime of kayaks (Fn < 0.5).
+
+    Args:
+        target_power: Paddler power output in Watts (scalar or array)
+        speeds: Speeds of the resistance curve in m/s, increasing
+        paddler_power: Paddler power at each speed in Watts
+
+    Returns:
+        float | np.ndarray: Cruising speed in m/s, same shape as target_power.
+                            Targets outside the curve are clamped to its end speeds.
+
+    Raises:
+        ValueError: If speeds and paddler_power differ in length or are empty
+
+    Example:
+        >>> results = calculate_resistance_curve(np.linspace(0.5, 4.0, 36), 5.0, 2.5)
+        >>> speeds = [r.speed for r in results]
+        >>> power = [r.paddler_power for r in results]
+        >>> calculate_cruise_speed_for_power(100.0, speeds, power)
+        2.34  # m/s
+    """
+    speeds = np.asarray(speeds, dtype=float)
+    paddler_power = np.asarray(paddler_power, dtype=float)
+    if speeds.size == 0 or speeds.shape != paddler_power.shape:
+        raise ValueError(
+            f"Speeds and paddler power must be non-empty and of equal length, "
+            f"got {speeds.size} and {paddler_power.size}"
         )
-        results.append(result)
 
-    return results
+    return np.interp(target_power, paddler_power, speeds)
 
 
 def calculate_energy_for_distance(
@@ -1,4 +1,6 @@
+from dataclasses import dataclass
 from typing import Tuple
+from functools import lru_cache
 import numpy as np
 from src.geometry.hull import Hull, read_file
 from src.geometry.point import Point3D
@@ -6,6 +8,83 @@ from src.geometry.point import Point3D
 # Physical constants
 GRAVITY = 9.81  # m/s² - acceleration due to gravity
 
+# Column layout of a stability curve, one row per heel angle
+STABILITY_POINT_DTYPE = np.dtype(
+    [
+        ("angle", "f8"),
+        ("gz", "f8"),
+        ("moment", "f8"),
+        ("cb_y", "f8"),
+        ("cb_z", "f8"),
+        ("cg_y", "f8"),
+        ("cg_z", "f8"),
+        ("waterline", "f8"),
+        ("displacement", "f8"),
+    ]
+)
+
+
+@dataclass
+class StabilityResult:
+    """Stability curve of a hull, stored column-wise (one array per quantity).
+
+    Attributes:
+        vanishing_angle: Heel angle where GZ becomes negative (degrees), or None
+        max_moment: Maximum positive righting moment (N·m)
+        max_moment_angle: Heel angle of the maximum righting moment (degrees)
+        angle: Heel angles (degrees)
+        gz: Righting arm at each angle (m)
+        moment: Righting moment at each angle (N·m)
+        cb_y: Transverse position of the center of buoyancy (m)
+        cb_z: Vertical position of the center of buoyancy (m)
+        cg_y: Transverse position of the rotated combined CG (m)
+        cg_z: Vertical position of the rotated combined CG (m)
+        waterline: Equilibrium waterline at each angle (m)
+        displacement: Displacement at each angle (kg)
+    """
+
+    vanishing_angle: float | None
+    max_moment: float
+    max_moment_angle: float
+    angle: np.ndarray
+    gz: np.ndarray
+    moment: np.ndarray
+    cb_y: np.ndarray
+    cb_z: np.ndarray
+    cg_y: np.ndarray
+    cg_z: np.ndarray
+    waterline: np.ndarray
+    displacement: np.ndarray
+
+    def points(self) -> list[dict]:
+        """Return the curve as one dict per heel angle (legacy row format)."""
+        names = STABILITY_POINT_DTYPE.names
+        columns = [getattr(self, name).tolist() for name in names]
+        return [dict(zip(names, row)) for row in zip(*columns)]
+
+
+def _combined_cg_coords(
+    hull_weight: float,
+    hull_cg_x: float,
+    hull_cg_y: float,
+    hull_cg_z: float,
+    payload_weight: float,
+    payload_cg_z: float,
+) -> Tuple[float, float, float]:
+    """Weighted average of the hull and payload CGs as a plain (x, y, z) tuple.
+
+    The payload is assumed centered longitudinally and laterally (the paddler
+    sits at the hull CG station, on the centerline).
+    """
+    total_weight = hull_weight + payload_weight
+
+    # Payload shares the hull CG's x and sits on the centerline (y = 0)
+    cg_x = hull_cg_x
+    cg_y = hull_weight * hull_cg_y / total_weight
+    cg_z = (hull_weight * hull_cg_z + payload_weight * payload_cg_z) / total_weight
+
+    return cg_x, cg_y, cg_z
+
 
 def calculate_combined_cg(
     hull_weight: float,
@@ -25,22 +104,72 @@ def calculate_combined_cg(
     Returns:
         Combined center of gravity as Point3D
     """
-    total_weight = hull_weight + payload_weight
+    return Point3D(
+        *_combined_cg_coords(
+            hull_weight, hull_cg.x, hull_cg.y, hull_cg.z, payload_weight, payload_cg_z
+        )
+    )
 
-    # Assume payload is centered longitudinally and laterally
-    # (paddler sits at center of kayak)
-    payload_cg_x = hull_cg.x  # Same longitudinal position as hull CG
-    payload_cg_y = 0.0  # Centered laterally
 
-    # Weighted average of CG positions
-    cg_x = (hull_weight * hull_cg.x + payload_weight * payload_cg_x) / total_weight
-    cg_y = (hull_weight * hull_cg.y + payload_weight * payload_cg_y) / total_weight
-    cg_z = (hull_weight * hull_cg.z + payload_weight * payload_cg_z) / total_weight
+@lru_cache(maxsize=32)
+def _angle_grid(max_angle: float, step: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return the heel angles (degrees) of a sweep with their cosines and sines.
 
-    return Point3D(cg_x, cg_y, cg_z)
+    The grid holds every multiple of step from 0 up to max_angle. It is built with
+    linspace so a float step cannot add or drop the endpoint through rounding.
 
+    Cached because design sweeps evaluate many hulls over the same angle grid.
+    The arrays are shared between calls, so they are marked read-only.
+    """
+    n = int(np.floor(max_angle / step + 1e-9)) + 1
+    angles = np.linspace(0.0, (n - 1) * step, n)
+    angles_rad = np.deg2rad(angles)
+    grid = (angles, np.cos(angles_rad), np.sin(angles_rad))
+    for arr in grid:
+        arr.flags.writeable = False
+    return grid
+
+
+def _righting_arm(
+    cb_y,
+    rotated_rel_y,
+    rotated_rel_z,
+    hull_cg_y: float,
+    hull_cg_z: float,
+    weight_force: float,
+):
+    """Calculate GZ and righting moment from the heeled CB and rotated CG offset.
+
+    Pure arithmetic, so it works element-wise on scalars or on arrays of angles.
 
-def create_stability_curve_points(
+    Args:
+        cb_y: Transverse position of the center of buoyancy (m)
+        rotated_rel_y: Combined CG offset from hull CG along y after rotation (m)
+        rotated_rel_z: Combined CG offset from hull CG along z after rotation (m)
+        hull_cg_y: Transverse position of the hull CG (m)
+        hull_cg_z: Vertical position of the hull CG (m)
+        weight_force: Hull plus payload weight as a force, total_weight × GRAVITY (N)
+
+    Returns:
+        Tuple of (gz, moment, combined_cg_y, combined_cg_z)
+    """
+    # Combined CG position after rotation
+    cg_y = hull_cg_y + rotated_rel_y
+    cg_z = hull_cg_z + rotated_rel_z
+
+    # GZ = righting arm (horizontal distance for restoring moment)
+    # For heel to starboard: CB moves to starboard (y<0), CG also moves but less
+    # Positive GZ = restoring moment = CG.y - CB.y (CB more to starboard)
+    gz = cg_y - cb_y
+
+    # Righting moment = Weight (force) × GZ
+    # Weight = mass × gravity, so moment is in N·m
+    moment = weight_force * gz
+
+    return gz, moment, cg_y, cg_z
+
+
+def calculate_stability(
     hull: Hull,
     paddler_cg_z: float = 0.25,
     paddler_weight: float = None,
@@ -48,7 +177,7 @@ def create_stability_curve_points(
     max_angle: float = 90,
     step: float = 3,
     break_on_vanishing: bool = False,
-) -> Tuple[float, float, float, list[dict]]:
+) -> StabilityResult:
     """Calculate stability curve (GZ curve) for a hull with payload.
 
     The righting arm GZ is the horizontal distance between:
@@ -69,69 +198,90 @@ def create_stability_curve_points(
         step: Angle increment (degrees)
 
     Returns:
-        List of dicts with angle, GZ, moment, CB position, etc.
+        StabilityResult with the summary values and one array per quantity
+
+    Raises:
+        ValueError: If step is not positive or max_angle is negative
     """
-    hull_weight = hull_weight or hull.target_weight
-    paddler_weight = paddler_weight or hull.target_payload
+    if not step > 0:
+        raise ValueError(f"Angle step must be positive, got {step}.")
+    if not max_angle >= 0:
+        raise ValueError(f"Maximum heel angle must be non-negative, got {max_angle}.")
+
+    # Only None means "use the hull's target": 0 is a valid weight (e.g. empty kayak)
+    hull_weight = hull.target_weight if hull_weight is None else hull_weight
+    paddler_weight = hull.target_payload if paddler_weight is None else paddler_weight
     total_weight = hull_weight + paddler_weight
+    weight_force = total_weight * GRAVITY
+    hull_cg_x, hull_cg_y, hull_cg_z = hull.cg.x, hull.cg.y, hull.cg.z
 
     # Calculate combined CG
-    combined_cg = calculate_combined_cg(hull_weight, hull.cg, paddler_weight, paddler_cg_z)
+    _, combined_cg_y, combined_cg_z = _combined_cg_coords(
+        hull_weight, hull_cg_x, hull_cg_y, hull_cg_z, paddler_weight, paddler_cg_z
+    )
 
     # print(f"Hull CG:     x={hull.cg.x:.3f}, y={hull.cg.y:.3f}, z={hull.cg.z:.3f} m")
     # print(f"Paddler CG:  x={hull.cg.x:.3f}, y=0.000, z={paddler_cg_z:.3f} m")
-    # print(f"Combined CG: x={combined_cg.x:.3f}, y={combined_cg.y:.3f}, z={combined_cg.z:.3f} m")
     # print(f"Hull weight: {hull_weight} kg, Paddler: {paddler_weight} kg, Total: {total_weight} kg")
     # print()
 
-    stability_points = []
-
-    for angle_deg in np.arange(0, max_angle + step, step):
-        angle_rad = np.radians(angle_deg)
-
-        # Calculate waterline and CB for this heel angle
-        # Hull rotates around its own CG
-        # Positive angle = heel to starboard (starboard side goes down)
-        waterline, cb, displacement = hull._calculate_waterline(total_weight, angle=angle_deg)
-
-        # The combined CG rotates with the hull around hull.cg
-        # Calculate the position of combined CG after rotation
-        # Relative to hull.cg:
-        rel_y = combined_cg.y - hull.cg.y  # = 0 (both centered)
-        rel_z = combined_cg.z - hull.cg.z  # positive (combined CG is higher)
-
-        # Rotate this relative position (positive angle = heel to starboard)
-        cos_a = np.cos(angle_rad)
-        sin_a = np.sin(angle_rad)
-        rotated_rel_y = rel_y * cos_a - rel_z * sin_a
-        rotated_rel_z = rel_y * sin_a + rel_z * cos_a
-
-        # Combined CG position after rotation
-        combined_cg_y_rotated = hull.cg.y + rotated_rel_y
-        combined_cg_z_rotated = hull.cg.z + rotated_rel_z
-
-        # GZ = righting arm (horizontal distance for restoring moment)
-        # For heel to starboard: CB moves to starboard (y<0), CG also moves but less
-        # Positive GZ = restoring moment = CG.y - CB.y (CB more to starboard)
-        gz = combined_cg_y_rotated - cb.y
-
-        # Righting moment = Weight (force) × GZ
-        # Weight = mass × gravity, so moment is in N·m
-        moment = total_weight * GRAVITY * gz  # in N·m
-
-        stability_points.append(
-            {
-                "angle": angle_deg,
-                "gz": gz,
-                "moment": moment,
-                "cb_y": cb.y,
-                "cb_z": cb.z,
-                "cg_y": combined_cg_y_rotated,
-                "cg_z": combined_cg_z_rotated,
-                "waterline": waterline,
-                "displacement": displacement,
-            }
+    # The combined CG rotates with the hull around hull.cg
+    # Position of combined CG relative to hull.cg:
+    rel_y = combined_cg_y - hull_cg_y  # = 0 (both centered)
+    rel_z = combined_cg_z - hull_cg_z  # positive (combined CG is higher)
+
+    # Rotate this relative position for every heel angle at once
+    # (positive angle = heel to starboard)
+    angles, cos_a, sin_a = _angle_grid(max_angle, step)
+    rotated_rel_y = rel_y * cos_a - rel_z * sin_a
+    rotated_rel_z = rel_y * sin_a + rel_z * cos_a
+
+    # One contiguous column per quantity, filled row by row
+    pts = np.empty(len(angles), dtype=STABILITY_POINT_DTYPE)
+    n = 0
+
+    # Angle of vanishing stability: first place GZ goes from >= 0 to negative.
+    # Tracked during the sweep; prev_gz starts negative so the upright point
+    # can never count as a sign change.
+    vanishing_angle = None
+    end = None
+    prev_gz = -1.0
+    prev_angle = 0.0
+
+    # Waterline and CB for each heel angle, solved in sweep order
+    # Hull rotates around its own CG
+    # Positive angle = heel to starboard (starboard side goes down)
+    # The angle grid's trig is reused to rotate the hull
+    waterlines = hull._calculate_waterlines(total_weight, angles, cos_a, sin_a)
+
+    # Iterate plain floats: NumPy scalar arithmetic is slower in a Python loop
+    for angle_deg, rot_y, rot_z, (waterline, cb, displacement) in zip(
+        angles.tolist(), rotated_rel_y.tolist(), rotated_rel_z.tolist(), waterlines
+    ):
+
+        gz, moment, combined_cg_y_rotated, combined_cg_z_rotated = _righting_arm(
+            cb.y, rot_y, rot_z, hull_cg_y, hull_cg_z, weight_force
+        )
+
+        pts[n] = (
+            angle_deg,
+            gz,
+            moment,
+            cb.y,
+            cb.z,
+            combined_cg_y_rotated,
+            combined_cg_z_rotated,
+            waterline,
+            displacement,
         )
+        n += 1
+
+        if gz < 0 <= prev_gz and end is None:
+            # Linear interpolation to find exact angle
+            vanishing_angle = prev_angle - prev_gz * (angle_deg - prev_angle) / (gz - prev_gz)
+            end = n - 1
+        prev_gz = gz
+        prev_angle = angle_deg
 
         # print(
         #     f"Angle {angle_deg:5.1f}° | GZ={gz:+.4f}m | "
@@ -142,22 +292,20 @@ def create_stability_curve_points(
             # print("Vanishing stability reached, stopping calculation.")
             break
 
-    # Find angle of vanishing stability (where GZ becomes negative)
-    vanishing_angle = None
+    pts = pts[:n]
+    moment = pts["moment"]
+    angles = pts["angle"]
+    if end is None:
+        end = n
+
+    # Maximum (positive) righting moment before stability vanishes, excluding upright
     max_moment = 0.0
     max_moment_angle = 0.0
-    for i in range(1, len(stability_points)):
-        if stability_points[i]["gz"] < 0 and stability_points[i - 1]["gz"] >= 0:
-            # Linear interpolation to find exact angle
-            gz1 = stability_points[i - 1]["gz"]
-            gz2 = stability_points[i]["gz"]
-            a1 = stability_points[i - 1]["angle"]
-            a2 = stability_points[i]["angle"]
-            vanishing_angle = a1 + (0 - gz1) * (a2 - a1) / (gz2 - gz1)
-            break
-        if stability_points[i]["moment"] > max_moment:
-            max_moment = stability_points[i]["moment"]
-            max_moment_angle = stability_points[i]["angle"]
+    if end > 1:
+        max_i = int(np.argmax(moment[1:end])) + 1
+        if moment[max_i] > 0:
+            max_moment = moment[max_i]
+            max_moment_angle = angles[max_i]
 
     # if vanishing_angle:
     #     print(f"\n⚠️  Angle of vanishing stability: {vanishing_angle:.1f}°")
@@ -169,26 +317,69 @@ def create_stability_curve_points(
     # print(f"Maximum GZ: {max_gz_point['gz']:.4f}m at {max_gz_point['angle']:.1f}°")
     # print(f"Maximum Righting Moment: {max_moment:.1f} N·m at {max_moment_angle:.1f}°")
 
-    return vanishing_angle, max_moment, max_moment_angle, stability_points
+    return StabilityResult(
+        vanishing_angle,
+        max_moment,
+        max_moment_angle,
+        **{name: pts[name].copy() for name in pts.dtype.names},
+    )
+
+
+def create_stability_curve_points(
+    hull: Hull,
+    paddler_cg_z: float = 0.25,
+    paddler_weight: float = None,
+    hull_weight: float = None,
+    max_angle: float = 90,
+    step: float = 3,
+    break_on_vanishing: bool = False,
+) -> Tuple[float, float, float, list[dict]]:
+    """Calculate the stability curve and return it as a list of per-angle dicts.
+
+    Thin wrapper around calculate_stability kept for callers that expect the row
+    format. Arguments are the same as calculate_stability.
 
+    Returns:
+        Tuple of (vanishing_angle, max_moment, max_moment_angle, stability_points)
+        where stability_points is a list of dicts with angle, GZ, moment, CB
+        position, etc.
+    """
+    result = calculate_stability(
+        hull,
+        paddler_cg_z=paddler_cg_z,
+        paddler_weight=paddler_weight,
+        hull_weight=hull_weight,
+        max_angle=max_angle,
+        step=step,
+        break_on_vanishing=break_on_vanishing,
+    )
+    return result.vanishing_angle, result.max_moment, result.max_moment_angle, result.points()
 
-def plot_stability_curve(stability_points: list[dict], hull_name: str = "Hull"):
-    """Plot the GZ curve."""
+
+def plot_stability_curve(stability_points: StabilityResult | list[dict], hull_name: str = "Hull"):
+    """Plot the GZ curve from a StabilityResult or a list of per-angle dicts."""
     import matplotlib.pyplot as plt
 
-    angles = [p["angle"] for p in stability_points]
-    gz_values = [p["gz"] for p in stability_points]
-    moments = [p["moment"] for p in stability_points]
+    if isinstance(stability_points, StabilityResult):
+        angles = stability_points.angle
+        gz_values = stability_points.gz
+        moments = stability_points.moment
+    else:
+        angles = np.array([p["angle"] for p in stability_points], dtype=float)
+        gz_values = np.array([p["gz"] for p in stability_points], dtype=float)
+        moments = np.array([p["moment"] for p in stability_points], dtype=float)
+
+    # moment = weight × g × GZ, so both curves share the same sign masks
+    positive = gz_values > 0
+    negative = gz_values < 0
 
     fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(10, 8), sharex=True)
 
     # GZ curve
     ax1.plot(angles, gz_values, "b-o", linewidth=2, markersize=4)
     ax1.axhline(y=0, color="red", linestyle="--", linewidth=1)
-    ax1.fill_between(
-        angles, gz_values, 0, where=[g > 0 for g in gz_values], alpha=0.3, color="green"
-    )
-    ax1.fill_between(angles, gz_values, 0, where=[g < 0 for g in gz_values], alpha=0.3, color="red")
+    ax1.fill_between(angles, gz_values, 0, where=positive, alpha=0.3, color="green")
+    ax1.fill_between(angles, gz_values, 0, where=negative, alpha=0.3, color="red")
     ax1.set_ylabel("GZ - Righting Arm (m)")
     ax1.set_title(f"Stability Curve (GZ) - {hull_name}")
     ax1.grid(True, alpha=0.3)
@@ -197,8 +388,8 @@ def plot_stability_curve(stability_points: list[dict], hull_name: str = "Hull"):
     # Moment curve
     ax2.plot(angles, moments, "g-o", linewidth=2, markersize=4)
     ax2.axhline(y=0, color="red", linestyle="--", linewidth=1)
-    ax2.fill_between(angles, moments, 0, where=[m > 0 for m in moments], alpha=0.3, color="green")
-    ax2.fill_between(angles, moments, 0, where=[m < 0 for m in moments], alpha=0.3, color="red")
+    ax2.fill_between(angles, moments, 0, where=positive, alpha=0.3, color="green")
+    ax2.fill_between(angles, moments, 0, where=negative, alpha=0.3, color="red")
     ax2.set_xlabel("Heel Angle (degrees)")
     ax2.set_ylabel("Righting Moment (N·m)")
     ax2.set_title("Righting Moment vs Heel Angle")
@@ -231,9 +422,11 @@ if __name__ == "__main__":
     print(f"Calculating stability curve with paddler CG at z={payload_cg_z}m")
     print("=" * 70)
 
-    stability_curve = create_stability_curve_points(
-        hull, paddler_cg_z=payload_cg_z, max_angle=90, step=5
-    )
+    result = calculate_stability(hull, paddler_cg_z=payload_cg_z, max_angle=90, step=5)
+
+    if result.vanishing_angle is not None:
+        print(f"Angle of vanishing stability: {result.vanishing_angle:.1f}°")
+    print(f"Maximum Righting Moment: {result.max_moment:.1f} N·m at {result.max_moment_angle:.1f}°")
 
     print("\n" + "=" * 70)
-    plot_stability_curve(stability_curve, hull.name)
+    plot_stability_curve(result, hull.name)
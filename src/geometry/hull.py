@@ -1,6 +1,6 @@
 import json
 import numpy as np
-from src.geometry.profile import Profile
+from src.geometry.profile import Profile, _pseudo_angle
 from src.geometry.point import Point3D
 from src.geometry.curve import Curve
 
@@ -14,6 +14,25 @@ class WaterlineCalculationError(Exception):
     pass
 
 
+# Scalar attributes reported by Hull.as_summary_dict
+_SUMMARY_FIELDS = (
+    "name",
+    "description",
+    "target_waterline",
+    "target_weight",
+    "target_payload",
+    "waterline",
+    "volume",
+    "displacement",
+    "min_x",
+    "max_x",
+    "min_y",
+    "max_y",
+    "min_z",
+    "max_z",
+)
+
+
 class Hull:
     name: str
     description: str | None = None
@@ -27,13 +46,35 @@ class Hull:
         self.curves: list[Curve] = []
         self.profiles: list[Profile] = []
         self.main_profiles: list[Profile] = []
+        # Empty bounds until build() or initialize_from_data() sets them
+        self.min_x = self.min_y = self.min_z = float("inf")
+        self.max_x = self.max_y = self.max_z = float("-inf")
+        # Upright station samples per step, see _upright_stations
+        self._station_cache: dict[float, tuple] = {}
 
     def _add_spline(self, spline: Curve):
         self.curves.append(spline)
 
     def as_dict(self):
+        """Return all hull attributes, including the curve and profile lists.
+
+        This is the instance __dict__ itself, so serializing it walks every curve and
+        profile point; use as_summary_dict() when only the hull metadata is needed.
+        """
         return self.__dict__
 
+    def as_summary_dict(self) -> dict:
+        """Return the scalar hull metadata (no curves or profiles).
+
+        CG and CB are given as (x, y, z) tuples. Attributes not set yet (e.g. before
+        build()) are None.
+        """
+        summary = {field: getattr(self, field, None) for field in _SUMMARY_FIELDS}
+        for field in ("cg", "cb"):
+            point = getattr(self, field, None)
+            summary[field] = None if point is None else (point.x, point.y, point.z)
+        return summary
+
     def length(self):
         return self.max_x - self.min_x
 
@@ -74,44 +115,30 @@ class Hull:
                 "Ensure waterline is calculated before calling wetted_surface_area()."
             )
 
-        x = self.min_x
         perimeters = []
         stations = []
 
         # Calculate wetted perimeter at each station
-        while x <= self.max_x:
-            points = []
-            for curve in self.curves:
-                try:
-                    point = curve.eval_x(x)
-                    points.append(point)
-                except ValueError:
-                    continue
-
-            if len(points) >= 3:
-                # Get points below waterline
-                points_below = self._get_points_below_waterline(points, waterline)
-                profile = Profile(x, points_below)
-
-                if profile.is_valid():
-                    perimeter = profile.wetted_perimeter()
-                    perimeters.append(perimeter)
-                    stations.append(x)
+        for x, pts in self._upright_stations(step):
+            # Get points below waterline
+            points_below = _clip_below_waterline(_sort_around_centroid(pts), waterline)
+            profile = Profile(x, points_below)
 
-            x += step
+            if profile.is_valid():
+                perimeter = profile.wetted_perimeter()
+                perimeters.append(perimeter)
+                stations.append(x)
 
         if len(perimeters) < 2:
             return 0.0
 
         # Integrate wetted perimeter along hull length using trapezoidal rule
         # S_w = ∫ P_w(x) dx ≈ Σ [(P_w(i) + P_w(i+1)) / 2] * Δx
-        wetted_area = 0.0
-        for i in range(len(perimeters) - 1):
-            avg_perimeter = (perimeters[i] + perimeters[i + 1]) / 2.0
-            dx = stations[i + 1] - stations[i]
-            wetted_area += avg_perimeter * dx
+        # (written out rather than np.trapz/np.trapezoid, which depend on the NumPy version)
+        perimeters = np.asarray(perimeters)
+        wetted_area = np.dot((perimeters[1:] + perimeters[:-1]) / 2.0, np.diff(stations))
 
-        return wetted_area
+        return float(wetted_area)
 
     def waterline_length(self, waterline: float = None, step: float = 0.05) -> float:
         """Calculate the waterline length (LWL) of the hull.
@@ -142,37 +169,21 @@ class Hull:
                 "Ensure waterline is calculated before calling waterline_length()."
             )
 
-        x = self.min_x
-        forward_x = None  # Forward-most station with waterline intersection
-        aft_x = None  # Aft-most station with waterline intersection
-
-        # Find forward-most and aft-most stations where hull intersects waterline
-        while x <= self.max_x:
-            points = []
-            for curve in self.curves:
-                try:
-                    point = curve.eval_x(x)
-                    points.append(point)
-                except ValueError:
-                    continue
-
-            if len(points) >= 3:
-                # Check if any points are below waterline (hull intersects waterline here)
-                has_submerged = any(p.z <= waterline for p in points)
-                has_emerged = any(p.z > waterline for p in points)
-
-                # Hull intersects waterline if it has both submerged and emerged points
-                if has_submerged and has_emerged:
-                    if aft_x is None:
-                        aft_x = x  # First intersection (aft)
-                    forward_x = x  # Keep updating (last intersection will be forward)
-
-            x += step
-
-        if aft_x is None or forward_x is None:
+        stations = self._upright_stations(step)
+        if not stations:
+            return 0.0
+
+        # Hull intersects the waterline at a station if it has both submerged
+        # (z <= waterline) and emerged (z > waterline) points there
+        xs = np.array([x for x, _ in stations])
+        z_min = np.array([pts[:, 2].min() for _, pts in stations])
+        z_max = np.array([pts[:, 2].max() for _, pts in stations])
+        crossing = np.flatnonzero((z_min <= waterline) & (z_max > waterline))
+        if crossing.size == 0:
             return 0.0
 
-        return forward_x - aft_x
+        # Forward-most minus aft-most intersecting station
+        return float(xs[crossing[-1]] - xs[crossing[0]])
 
     def waterline_beam(self, waterline: float = None, step: float = 0.05) -> float:
         """Calculate the maximum beam (width) of the hull at the waterline.
@@ -202,49 +213,105 @@ class Hull:
                 "Ensure waterline is calculated before calling waterline_beam()."
             )
 
-        x = self.min_x
         max_beam = 0.0
 
         # Find maximum beam at waterline across all stations
-        while x <= self.max_x:
-            points = []
-            for curve in self.curves:
-                try:
-                    point = curve.eval_x(x)
-                    points.append(point)
-                except ValueError:
-                    continue
-
-            if len(points) >= 3:
-                # Find points at or near the waterline
-                # We look for points within a small tolerance of the waterline,
-                # or interpolate between points above and below
-                waterline_y_coords = []
-
-                n = len(points)
-                for i in range(n):
-                    p1 = points[i]
-                    p2 = points[(i + 1) % n]
-
-                    # If point is at waterline, add it
-                    if abs(p1.z - waterline) < 1e-6:
-                        waterline_y_coords.append(abs(p1.y))
-
-                    # If edge crosses waterline, interpolate
-                    if (p1.z < waterline < p2.z) or (p2.z < waterline < p1.z):
-                        t = (waterline - p1.z) / (p2.z - p1.z)
-                        intersect_y = p1.y + t * (p2.y - p1.y)
-                        waterline_y_coords.append(abs(intersect_y))
-
-                # Calculate beam at this station
-                if len(waterline_y_coords) >= 2:
-                    station_beam = max(waterline_y_coords) * 2  # Port to starboard
-                    max_beam = max(max_beam, station_beam)
-
-            x += step
+        for _, pts in self._upright_stations(step):
+            waterline_y_coords = _waterline_offsets(pts, waterline)
+
+            # Calculate beam at this station
+            if waterline_y_coords.size >= 2:
+                station_beam = waterline_y_coords.max() * 2  # Port to starboard
+                max_beam = max(max_beam, float(station_beam))
 
         return max_beam
 
+    def waterplane_area(self, waterline: float = None, step: float = 0.05) -> float:
+        """Calculate the waterplane area (area of the hull's footprint on the water surface).
+
+        The half-beam at the waterline is integrated along the stations with the
+        trapezoidal rule and doubled for port and starboard.
+
+        Args:
+            waterline: The z-coordinate of the waterline. If None, uses self.waterline.
+            step: The longitudinal step size for integration in meters. Default 0.05 m.
+
+        Returns:
+            float: Waterplane area in square meters (m²)
+
+        Raises:
+            ValueError: If waterline is not set or invalid
+
+        Example:
+            >>> hull.waterplane_area()
+            1.850  # m²
+        """
+        if waterline is None:
+            waterline = self.waterline
+        if waterline is None or waterline <= 0:
+            raise ValueError(
+                f"Invalid waterline: {waterline}. "
+                "Ensure waterline is calculated before calling waterplane_area()."
+            )
+
+        half_beams = []  # Half-beam at each station (centerline to max y)
+        stations = []
+
+        # Calculate half-beam at waterline for each station
+        for x, pts in self._upright_stations(step):
+            waterline_y_coords = _waterline_offsets(pts, waterline)
+            if waterline_y_coords.size:
+                # Half-beam is maximum y-coordinate at this station
+                half_beams.append(waterline_y_coords.max())
+                stations.append(x)
+
+        if len(half_beams) < 2:
+            return 0.0
+
+        # Integrate half-beam along length, then double for full waterplane area
+        # Awp = 2 * ∫ half_beam(x) dx  (factor of 2 for port and starboard)
+        half_beams = np.asarray(half_beams)
+        area = float(np.dot((half_beams[1:] + half_beams[:-1]) / 2.0, np.diff(stations)))
+
+        return 2.0 * area  # Double for full waterplane (port + starboard)
+
+    def max_section_area(self, waterline: float = None, step: float = 0.05) -> float:
+        """Calculate the largest submerged cross-section area along the hull.
+
+        Args:
+            waterline: The z-coordinate of the waterline. If None, uses self.waterline.
+            step: The longitudinal step size for sampling in meters. Default 0.05 m.
+
+        Returns:
+            float: Maximum submerged cross-section area in square meters (m²)
+
+        Raises:
+            ValueError: If waterline is not set or invalid
+
+        Example:
+            >>> hull.max_section_area()
+            0.095  # m²
+        """
+        if waterline is None:
+            waterline = self.waterline
+        if waterline is None or waterline <= 0:
+            raise ValueError(
+                f"Invalid waterline: {waterline}. "
+                "Ensure waterline is calculated before calling max_section_area()."
+            )
+
+        max_area = 0.0
+
+        # Find maximum cross-section area along the hull
+        for x, pts in self._upright_stations(step):
+            # Get points below waterline
+            profile = Profile(x, _clip_below_waterline(_sort_around_centroid(pts), waterline))
+
+            if profile.is_valid():
+                max_area = max(max_area, profile.calculate_area())
+
+        return max_area
+
     def initialize_from_data(self, data: dict):
         self.name = data.get("name", "KAYAK HULL")
         self.description = data.get("description", "KAYAK HULL")
@@ -289,35 +356,21 @@ class Hull:
         self.target_weight = data.get("target_weight", 100)
         self.target_payload = data.get("target_payload", 100)
 
-        self.min_x = float("inf")
-        self.max_x = float("-inf")
-        self.min_y = float("inf")
-        self.max_y = float("-inf")
-        self.min_z = float("inf")
-        self.max_z = float("-inf")
-
         for spline_data in data.get("curves", []):
             name = spline_data["name"] = spline_data.get("name", "Unnamed Curve")
-            points = []
-            oposite = []
-            y = 0.0
-            for point in spline_data.get("points", []):
-                p = Point3D(point[0], point[1], point[2])
-                self._update_min_max(p)
-                points.append(p)
-                y += np.abs(point[1])
+            # Load the whole curve at once; the mirror only flips the sign of y
+            xyz = np.asarray(spline_data.get("points", []), dtype=float).reshape(-1, 3)
+            points = [Point3D(x, y, z) for x, y, z in xyz.tolist()]
 
             spline = Curve(name, points, mirrored=False)
             self._add_spline(spline)
-            if y > 0:
-                for point in spline_data.get("points", []):
-                    p = Point3D(point[0], -point[1], point[2])
-                    self._update_min_max(p)
-                    oposite.append(p)
-
+            if np.abs(xyz[:, 1]).sum() > 0:
+                oposite = [Point3D(x, y, z) for x, y, z in (xyz * (1.0, -1.0, 1.0)).tolist()]
                 spline_oposite = Curve("Mirror of " + name, oposite, mirrored=True)
                 self._add_spline(spline_oposite)
 
+        self._set_bounds_from_curves()
+
         volume, cg = self._calculate_profiles_volume_and_cg()
         self.volume = volume
         self.cg = cg
@@ -341,45 +394,37 @@ class Hull:
                           sorted by station (x-coordinate)
         """
         main_profiles = []
-        stations = {}
-        # Get all possible stations from all curves
-        for spline in self.curves:
-            for point in spline.points:
-                stations[point.x] = True
+        if not self.curves:
+            return main_profiles
+        # Get all possible stations from all curves, sorted and without repeats
+        stations = np.unique(np.concatenate([spline.x for spline in self.curves])).tolist()
 
         # Calculate a profile for each station
-        for station in sorted(stations.keys()):
-            points = self._get_points_at(station)
-            if len(points) >= 3:
-                profile = Profile(station, points)
-                if profile.is_valid():
-                    main_profiles.append(profile)
+        for station, points in self._points_at_stations(self.curves, stations):
+            profile = Profile(station, points)
+            if profile.is_valid():
+                main_profiles.append(profile)
 
         return main_profiles
 
     def _calculate_profiles_volume_and_cg(self):
-        x = self.min_x
         step = 0.05
         profiles = []
-        volumes = []
-        cgs = []
-        while x <= self.max_x:
-            points = self._get_points_at(x)
-            if len(points) >= 3:
-                profile = Profile(x, points)
-                if profile.is_valid():
-                    volume, cg = profile.calculate_volume_and_cg(step)
-                    if volume > 0:
-                        profiles.append(profile)
-                        volumes.append(volume)
-                        cgs.append(cg)
-            x += step
+        # Running volume and first moments: the CG falls out without a second pass
+        volume = moment_x = moment_y = moment_z = 0.0
+        for x, pts in self._upright_stations(step):
+            profile = Profile(x, pts)
+            if profile.is_valid():
+                slice_volume, slice_cg = profile.calculate_volume_and_cg(step)
+                if slice_volume > 0:
+                    profiles.append(profile)
+                    volume += slice_volume
+                    moment_x += slice_volume * slice_cg.x
+                    moment_y += slice_volume * slice_cg.y
+                    moment_z += slice_volume * slice_cg.z
 
         self.profiles = profiles  # Store profiles for potential visualization or further analysis
 
-        # Calculate total volume
-        volume = sum(volumes)
-
         # Check if we have valid volume
         if volume == 0:
             raise WaterlineCalculationError(
@@ -388,90 +433,132 @@ class Hull:
                 "valid 3D shape with non-zero cross-sections."
             )
 
-        # Calculate weighted CG
-        cgx = 0.0
-        cgy = 0.0
-        cgz = 0.0
-        for i in range(len(volumes)):
-            cgx += volumes[i] * cgs[i].x
-            cgy += volumes[i] * cgs[i].y
-            cgz += volumes[i] * cgs[i].z
-
-        # Divide by total volume
-        cgx /= volume
-        cgy /= volume
-        cgz /= volume
+        cg = Point3D(moment_x / volume, moment_y / volume, moment_z / volume)
 
         self.volume = volume
-        self.cg = Point3D(cgx, cgy, cgz)
-        return volume, Point3D(cgx, cgy, cgz)
-
-    def _update_min_max(self, point: Point3D):
-        if point.x < self.min_x:
-            self.min_x = point.x
-        if point.x > self.max_x:
-            self.max_x = point.x
-        if point.y < self.min_y:
-            self.min_y = point.y
-        if point.y > self.max_y:
-            self.max_y = point.y
-        if point.z < self.min_z:
-            self.min_z = point.z
-        if point.z > self.max_z:
-            self.max_z = point.z
-
-    def _get_points_at(
-        self,
-        x: float,
-    ) -> list[Point3D]:
-        points = []
-        for curve in self.curves:
+        self.cg = cg
+        return volume, cg
+
+    def _set_bounds_from_curves(self):
+        """Set the hull bounds from the control points of all curves (mirrors included).
+
+        Each curve keeps its control points as an (n, 3) array, so they are
+        concatenated once and reduced with min/max instead of comparing every
+        point in Python.
+        """
+        if not self.curves:
+            self.min_x = self.min_y = self.min_z = float("inf")
+            self.max_x = self.max_y = self.max_z = float("-inf")
+            return
+
+        xyz = np.concatenate([curve.xyz for curve in self.curves])
+        self.min_x, self.min_y, self.min_z = xyz.min(axis=0).tolist()
+        self.max_x, self.max_y, self.max_z = xyz.max(axis=0).tolist()
+
+    def _calculate_waterlines(self, weight: float, angles, cos_a=None, sin_a=None):
+        """Solve the equilibrium waterline for a sequence of heel angles.
+
+        Each solve starts from the previous angle's waterline, which is much closer
+        to the answer than the upright one for a fine angle grid. Results are yielded
+        lazily so callers can stop the sweep early. If a warm-started solve fails
+        (coarse grids can start the first update too far off), the angle is
+        re-solved from the default starting waterline.
+
+        Args:
+            weight: Total weight to support (kg)
+            angles: Heel angles in degrees, in sweep order
+            cos_a: Optional cosines of the heel angles, reused for the hull rotation
+            sin_a: Optional sines of the heel angles, reused for the hull rotation
+
+        Yields:
+            Tuple of (waterline, cb, displacement) for each angle
+        """
+        waterline = None
+        for i, angle in enumerate(angles):
+            rotation = None if cos_a is None else (cos_a[i], sin_a[i])
             try:
-                point = curve.eval_x(x)
-                points.append(point)
-            except ValueError:
-                continue
-        return points
-
-    def _calculate_waterline(self, weight: float, angle: float = 0.0):
-        waterline = self.waterline or self.target_waterline or self.depth() / 3
+                waterline, cb, displacement = self._calculate_waterline(
+                    weight, angle=angle, initial_waterline=waterline, rotation=rotation
+                )
+            except WaterlineCalculationError:
+                if waterline is None:
+                    raise
+                waterline, cb, displacement = self._calculate_waterline(
+                    weight, angle=angle, rotation=rotation
+                )
+            yield waterline, cb, displacement
+
+    def _heeled_stations(
+        self, step: float, angle: float, rotation: tuple[float, float] | None = None
+    ) -> list[tuple[float, np.ndarray]]:
+        """Return the hull's station samples rotated around the hull CG by the heel angle.
+
+        The upright station samples are rotated with one matrix product, so the heeled
+        hull is exactly the upright hull turned about the x-axis (x, and hence the set
+        of defined stations, is unchanged).
+
+        Args:
+            step: Station spacing in meters
+            angle: Heel angle in degrees
+            rotation: Optional (cos, sin) of the angle, to skip recomputing the trig
+
+        Returns:
+            list of (station, (n, 3) points) for stations with at least 3 points
+        """
+        stations = self._upright_stations(step)
+        if angle == 0.0 or not stations:
+            return stations
+        if rotation is None:
+            angle_rad = np.radians(angle)
+            rotation = (np.cos(angle_rad), np.sin(angle_rad))
+        cos_a, sin_a = rotation
+
+        # Same right-hand rotation about the x-axis as Spline3D.apply_rotation_on_x_axis
+        matrix = np.array([[1.0, 0.0, 0.0], [0.0, cos_a, -sin_a], [0.0, sin_a, cos_a]])
+        origin = np.array([self.cg.x, self.cg.y, self.cg.z])
+        points = np.concatenate([pts for _, pts in stations])
+        rotated = (points - origin) @ matrix.T + origin
+        splits = np.cumsum([len(pts) for _, pts in stations])[:-1]
+        return [(x, pts) for (x, _), pts in zip(stations, np.split(rotated, splits))]
+
+    def _calculate_waterline(
+        self,
+        weight: float,
+        angle: float = 0.0,
+        initial_waterline: float | None = None,
+        rotation: tuple[float, float] | None = None,
+    ):
+        # Loop invariants bound to locals once rather than re-read every iteration
+        depth = self.depth()
+        waterline = initial_waterline or self.waterline or self.target_waterline or depth / 3
         max_iterations = 50  # Prevent infinite loops
         iteration = 0
+        previous = None  # (waterline, displacement) of the previous iteration
+        low, high = 0.0, float("inf")  # Waterlines known to float too high / sink too low
 
-        while 0 < waterline and waterline <= self.depth() and iteration < max_iterations:
+        step = 0.05
+        # Curve samples and their circular order depend only on the heel, so each
+        # station is sampled, rotated and sorted once per solve and only clipped per iteration
+        stations = [
+            (x, _sort_around_centroid(pts), pts[:, 2].min())
+            for x, pts in self._heeled_stations(step, angle, rotation)
+        ]
+
+        while 0 < waterline and waterline <= depth and iteration < max_iterations:
             iteration += 1
-            x = self.min_x
-            step = 0.05
-            profiles = []
-            volumes = []
-            cgs = []
-
-            while x <= self.max_x:
-                points = []
-                for curve in self.curves:
-                    if angle != 0.0:
-                        leaned_curve = curve.apply_rotation_on_x_axis(self.cg, angle)
-                    else:
-                        leaned_curve = curve
-                    try:
-                        point = leaned_curve.eval_x(x)
-                        points.append(point)
-                    except ValueError:
-                        continue
-
-                if len(points) >= 3:
-                    points = self._get_points_below_waterline(points, waterline)
-                    profile = Profile(x, points)
-                    if profile.is_valid():
-                        volume, cg = profile.calculate_volume_and_cg(step)
-                        if volume > 0:
-                            profiles.append(profile)
-                            volumes.append(volume)
-                            cgs.append(cg)
-                x += step
-
-            # Calculate total volume
-            volume = sum(volumes)
+            volume = moment_x = moment_y = moment_z = 0.0
+
+            for x, pts, z_min in stations:
+                if z_min >= waterline:
+                    continue  # Station is entirely out of the water
+                profile = Profile(x, _clip_below_waterline(pts, waterline))
+                if profile.is_valid():
+                    slice_volume, slice_cg = profile.calculate_volume_and_cg(step)
+                    if slice_volume > 0:
+                        volume += slice_volume
+                        moment_x += slice_volume * slice_cg.x
+                        moment_y += slice_volume * slice_cg.y
+                        moment_z += slice_volume * slice_cg.z
 
             # Check if we have a valid volume
             if volume == 0:
@@ -482,32 +569,40 @@ class Hull:
                     f"defined."
                 )
 
-            # Calculate weighted CG
-            cgx = 0.0
-            cgy = 0.0
-            cgz = 0.0
-            for i in range(len(volumes)):
-                cgx += volumes[i] * cgs[i].x
-                cgy += volumes[i] * cgs[i].y
-                cgz += volumes[i] * cgs[i].z
-
-            # Divide by total volume
-            cgx /= volume
-            cgy /= volume
-            cgz /= volume
-
-            cb = Point3D(cgx, cgy, cgz)
+            cb = Point3D(moment_x / volume, moment_y / volume, moment_z / volume)
 
             displacement = volume * 1000  # Assuming density of water is 1000 kg/m³
             diff = weight - displacement
-            if abs(diff) > 1:  # assume a tolerance of 0.1 kg in the calculation
-                increment = (
-                    diff / weight * waterline
-                )  # Adjust waterline proportionally to the difference in weight
-                waterline += increment  # add the increment to the waterline to try to match the target weight
-            else:
+            if abs(diff) <= 1:  # assume a tolerance of 1 kg in the calculation
                 break
 
+            # Narrow the bracket around the equilibrium waterline
+            if diff > 0:
+                low = max(low, waterline)
+            else:
+                high = min(high, waterline)
+
+            if previous is not None and displacement != previous[1]:
+                # Secant step on displacement(waterline) - weight
+                last_waterline, last_displacement = previous
+                next_waterline = waterline + diff * (waterline - last_waterline) / (
+                    displacement - last_displacement
+                )
+            else:
+                # First step: adjust waterline proportionally to the difference in weight
+                next_waterline = waterline + diff / weight * waterline
+            if high < float("inf"):
+                if not low < next_waterline < high:
+                    next_waterline = (low + high) / 2  # Secant left the bracket: bisect
+            elif low < depth and not low < next_waterline <= depth:
+                # No sample has sunk too low yet, so the deck bounds the bracket: a flat
+                # displacement curve must not throw the secant out of the hull while a
+                # root may still exist. Past the deck, try the deck itself; if even that
+                # floats too high (low == depth), the step is left to go out of bounds.
+                next_waterline = depth if next_waterline > depth else (low + depth) / 2
+            previous = (waterline, displacement)
+            waterline = next_waterline
+
         # If we exited due to bounds or iterations, raise an exception
         if not locals().get("cb"):
             if iteration >= max_iterations:
@@ -519,12 +614,12 @@ class Hull:
                     f"{self.volume * 1000:.1f}kg. The target weight may "
                     f"exceed the hull's buoyancy capacity."
                 )
-            elif waterline <= 0 or waterline > self.depth():
+            elif waterline <= 0 or waterline > depth:
                 max_displacement = self.volume * 1000
                 raise WaterlineCalculationError(
                     f"Waterline calculation went out of bounds "
                     f"(waterline: {waterline:.3f}m, "
-                    f"depth: {self.depth():.3f}m). Target weight: "
+                    f"depth: {depth:.3f}m). Target weight: "
                     f"{weight:.1f}kg, Maximum possible displacement: "
                     f"{max_displacement:.1f}kg. The hull geometry cannot "
                     f"support the requested weight."
@@ -532,6 +627,48 @@ class Hull:
 
         return waterline, cb, displacement
 
+    def _upright_stations(self, step: float) -> list[tuple[float, np.ndarray]]:
+        """Return the upright curve samples at every station from min_x to max_x.
+
+        Stations where fewer than three curves are defined are skipped, since they
+        cannot form a profile. The samples are cached per step: the hull volume sweep,
+        every waterline solve (heeled or not) and the waterline geometry queries all
+        read the same grid. The cache is rebuilt if the bounds or the curves change,
+        and the cached arrays are read-only.
+        """
+        key = (self.min_x, self.max_x, tuple(self.curves))
+        cached = self._station_cache.get(step)
+        if cached is None or cached[0] != key:
+            xs = _station_grid(self.min_x, self.max_x, step)
+            stations = self._station_arrays(self.curves, xs)
+            for _, pts in stations:
+                pts.flags.writeable = False
+            cached = self._station_cache[step] = (key, stations)
+        return cached[1]
+
+    def _points_at_stations(
+        self, curves: list, xs: list[float]
+    ) -> list[tuple[float, list[Point3D]]]:
+        """Evaluate the curves at the given stations, keeping those with 3+ points."""
+        return [
+            (x, [Point3D(*p) for p in pts.tolist()]) for x, pts in self._station_arrays(curves, xs)
+        ]
+
+    def _station_arrays(self, curves: list, xs: list[float]) -> list[tuple[float, np.ndarray]]:
+        """Same as _points_at_stations, with each station's points as an (n, 3) array."""
+        if not xs or not curves:
+            return []
+
+        # One batch evaluation per curve; NaN rows mark stations outside a curve
+        samples = np.stack([curve.eval_x_batch(xs) for curve in curves], axis=1)
+        defined = ~np.isnan(samples).any(axis=2)
+
+        return [
+            (x, row[mask])
+            for x, row, mask in zip(xs, samples, defined)
+            if np.count_nonzero(mask) >= 3
+        ]
+
     def _get_points_below_waterline(self, points: list[Point3D], waterline: float) -> list[Point3D]:
         """Get points below the waterline, including intersection points.
 
@@ -541,29 +678,77 @@ class Hull:
         if len(points) < 3:
             return []
 
-        # Sort points in circular order around centroid (same as Profile.sort_points)
-        cy = sum(p.y for p in points) / len(points)
-        cz = sum(p.z for p in points) / len(points)
-        sorted_points = sorted(points, key=lambda p: np.arctan2(p.z - cz, p.y - cy))
+        pts = np.array([(p.x, p.y, p.z) for p in points], dtype=float)
+        clipped = _clip_below_waterline(_sort_around_centroid(pts), waterline)
+        return [Point3D(x, y, z) for x, y, z in clipped.tolist()]
+
 
-        below_points = []
-        n = len(sorted_points)
+def _station_grid(min_x: float, max_x: float, step: float) -> list[float]:
+    """Return the stations min_x, min_x + step, ... up to max_x.
 
-        for i in range(n):
-            p1 = sorted_points[i]
-            p2 = sorted_points[(i + 1) % n]  # Next point (wrap around)
+    Station i is min_x + i * step rather than a running sum, so float drift cannot
+    decide whether max_x itself is included. The last station is clipped to max_x so
+    rounding cannot push it past the end of the curves.
+    """
+    if not min_x <= max_x:
+        return []
+    count = int(np.floor((max_x - min_x) / step + 1e-9)) + 1
+    return np.minimum(min_x + step * np.arange(count), max_x).tolist()
+
+
+def _sort_around_centroid(pts: np.ndarray) -> np.ndarray:
+    """Return (n, 3) points in circular order around their centroid in the y-z plane.
+
+    Same order as Profile.sort_points.
+    """
+    cy, cz = pts[:, 1:].mean(axis=0)
+    return pts[np.argsort(_pseudo_angle(pts[:, 1] - cy, pts[:, 2] - cz), kind="stable")]
+
+
+def _waterline_offsets(pts: np.ndarray, waterline: float) -> np.ndarray:
+    """Return |y| of every point where a station's outline meets the waterline.
+
+    The outline joins the (n, 3) points in curve order, wrapping around. Points within
+    1e-6 of the waterline count as on it; edges that strictly cross it are interpolated.
+    """
+    y1, z1 = pts[:, 1], pts[:, 2]
+    y2, z2 = np.roll(y1, -1), np.roll(z1, -1)
+
+    # Points at the waterline (within tolerance)
+    at_waterline = np.abs(z1 - waterline) < 1e-6
+    # Edges crossing the waterline, interpolated to it
+    crosses = ((z1 < waterline) & (waterline < z2)) | ((z2 < waterline) & (waterline < z1))
+    t = (waterline - z1[crosses]) / (z2[crosses] - z1[crosses])
+    intersect_y = y1[crosses] + t * (y2[crosses] - y1[crosses])
+
+    return np.abs(np.concatenate((y1[at_waterline], intersect_y)))
+
+
+def _clip_below_waterline(p1: np.ndarray, waterline: float) -> np.ndarray:
+    """Clip circularly sorted (n, 3) points to the waterline.
+
+    Keeps the points at or below the waterline and adds the intersection of every
+    edge that crosses it, in polygon order, as an (m, 3) array.
+    """
+    p2 = np.roll(p1, -1, axis=0)  # Next point (wrap around)
 
-            if p1.z <= waterline:
-                below_points.append(p1)
+    below = p1[:, 2] <= waterline
+    # Edges that strictly cross the waterline
+    crosses = ((p1[:, 2] < waterline) & (waterline < p2[:, 2])) | (
+        (p2[:, 2] < waterline) & (waterline < p1[:, 2])
+    )
 
-            # Check if edge crosses waterline
-            if (p1.z < waterline < p2.z) or (p2.z < waterline < p1.z):
-                # Edge crosses the waterline, find intersection
-                t = (waterline - p1.z) / (p2.z - p1.z)
-                intersect_y = p1.y + t * (p2.y - p1.y)
-                below_points.append(Point3D(p1.x, intersect_y, waterline))
+    intersections = p1.copy()
+    if crosses.any():
+        a, b = p1[crosses], p2[crosses]
+        t = (waterline - a[:, 2]) / (b[:, 2] - a[:, 2])
+        intersections[crosses, 1] = a[:, 1] + t * (b[:, 1] - a[:, 1])
+        intersections[crosses, 2] = waterline
 
-        return below_points
+    # Interleave each kept point with the intersection on its outgoing edge
+    rows = np.stack((p1, intersections), axis=1).reshape(-1, 3)
+    keep = np.column_stack((below, crosses)).ravel()
+    return rows[keep]
 
 
 def read_file(file_path: str) -> dict:
@@ -619,6 +804,10 @@ if __name__ == "__main__":
     print(f"Hull Waterline: {hull.waterline:.3f} m")
     print(f"Hull Center of Buoyancy: {hull.cb}")
     print(f"Hull Displacement: {hull.displacement:.2f} kg")
+    # These reuse the station samples cached while building the hull
+    print(f"Hull Wetted Surface Area: {hull.wetted_surface_area():.3f} m²")
+    print(f"Hull Waterline Length: {hull.waterline_length():.3f} m")
+    print(f"Hull Waterline Beam: {hull.waterline_beam():.3f} m")
 
     # print(json.dumps(hull.as_dict(), indent=2))
 
@@ -2,6 +2,8 @@
 Point3D class for representing 3D coordinates and basic geometric operations.
 """
 
+import math
+
 import numpy as np
 
 
@@ -96,9 +98,9 @@ class Point3D:
         Returns:
             New rotated Point3D
         """
-        angle_rad = np.radians(angle_deg)
-        cos_a = np.cos(angle_rad)
-        sin_a = np.sin(angle_rad)
+        angle_rad = math.radians(angle_deg)
+        cos_a = math.cos(angle_rad)
+        sin_a = math.sin(angle_rad)
 
         # Rotation matrix around X-axis
         # [1    0       0   ]
@@ -121,9 +123,9 @@ class Point3D:
         Returns:
             New rotated Point3D
         """
-        angle_rad = np.radians(angle_deg)
-        cos_a = np.cos(angle_rad)
-        sin_a = np.sin(angle_rad)
+        angle_rad = math.radians(angle_deg)
+        cos_a = math.cos(angle_rad)
+        sin_a = math.sin(angle_rad)
 
         # Rotation matrix around Y-axis
         # [ cos(a)  0  sin(a)]
@@ -146,9 +148,9 @@ class Point3D:
         Returns:
             New rotated Point3D
         """
-        angle_rad = np.radians(angle_deg)
-        cos_a = np.cos(angle_rad)
-        sin_a = np.sin(angle_rad)
+        angle_rad = math.radians(angle_deg)
+        cos_a = math.cos(angle_rad)
+        sin_a = math.sin(angle_rad)
 
         # Rotation matrix around Z-axis
         # [cos(a) -sin(a)  0]
@@ -3,29 +3,84 @@ from typing import List
 from src.geometry.point import Point3D
 
 
+def _unique_mask(xyz: np.ndarray) -> np.ndarray:
+    """Return a mask of the rows of xyz not np.isclose to an earlier kept row.
+
+    All pairwise comparisons are done in one broadcast np.isclose call instead of
+    one call per coordinate per pair.
+    """
+    kept = np.ones(len(xyz), dtype=bool)
+    if len(xyz) < 2:
+        return kept
+
+    # close[i, j]: row i matches row j (j plays the "already kept" role)
+    close = np.isclose(xyz[:, None, :], xyz[None, :, :]).all(axis=2)
+    for i in range(1, len(xyz)):
+        kept[i] = not (close[i, :i] & kept[:i]).any()
+    return kept
+
+
+def _unique_points(points: List[Point3D]) -> List[Point3D]:
+    """Drop points that are np.isclose to an earlier kept point, keeping input order."""
+    if len(points) < 2:
+        return list(points)
+
+    kept = _unique_mask(np.array([(p.x, p.y, p.z) for p in points]))
+    return [p for p, keep in zip(points, kept) if keep]
+
+
+def _pseudo_angle(dy: np.ndarray, dz: np.ndarray) -> np.ndarray:
+    """Return a key in [-2, 2] that increases with np.arctan2(dz, dy).
+
+    This is the "diamond angle": dy / (|dy| + |dz|) walks the unit diamond instead of
+    the unit circle, which orders directions the same way without any trig call.
+    A zero vector maps to 0, like arctan2(0, 0).
+    """
+    norm = np.abs(dy) + np.abs(dz)
+    d = np.divide(dy, norm, out=np.ones_like(norm, dtype=float), where=norm > 0)
+    return np.where(dz >= 0, 1.0 - d, d - 1.0)
+
+
 class Profile:
-    station: float = 0.0
+    # Profiles are built per station on every waterline iteration; slots keep them small.
+    # The coordinates live in an (n, 3) array; Point3D objects are only built on demand.
+    __slots__ = ("station", "_points", "_xyz_cache")
+
+    station: float
+
+    def __init__(self, station: float = 0.0, points: List[Point3D] | np.ndarray = None):
+        """Create a profile at a station.
 
-    def __init__(self, station: float = 0.0, points: List[Point3D] = None):
+        points may be a list of Point3D or an (n, 3) array of x, y, z coordinates.
+        A profile built from an array only creates Point3D objects if .points is read.
+        """
         if points is None:
             points = []
-        self.points = []
-        for new in points:
-            for old in self.points:
-                if (
-                    np.isclose(new.x, old.x)
-                    and np.isclose(new.y, old.y)
-                    and np.isclose(new.z, old.z)
-                ):
-                    break
-            else:
-                self.points.append(new)
         self.station = station
-        self.sort_points()
+        if isinstance(points, np.ndarray):
+            xyz = np.asarray(points, dtype=float).reshape(-1, 3)
+            self._points = None
+            self._xyz_cache = xyz[_unique_mask(xyz)]
+        else:
+            self._points = _unique_points(points)
+            self._xyz_cache = None
+        self._sort_by_angle()
+
+    @property
+    def points(self) -> List[Point3D]:
+        """The profile points as Point3D objects, in the same order as as_array()."""
+        if self._points is None:
+            self._points = [Point3D(x, y, z) for x, y, z in self._xyz_cache.tolist()]
+        return self._points
+
+    @points.setter
+    def points(self, points: List[Point3D]):
+        self._points = points
+        self._xyz_cache = None
 
     def is_valid(self) -> bool:
         """Check if the profile has at least 3 points to form a valid shape."""
-        return len(self.points) >= 3
+        return len(self.as_array()) >= 3
 
     def validate_station_plane(self, tolerance: float = 1e-6) -> bool:
         """Validate that all points lie in the station plane x = self.station.
@@ -36,14 +91,29 @@ class Profile:
         Returns:
             True if all points are in the plane, False otherwise
         """
-        for point in self.points:
-            if not np.isclose(point.x, self.station, atol=tolerance):
-                return False
-        return True
+        x = self.as_array()[:, 0]
+        return bool(np.isclose(x, self.station, atol=tolerance).all())
 
     def get_points(self) -> List[Point3D]:
         return self.points
 
+    def as_array(self) -> np.ndarray:
+        """Return the points as an (n, 3) array of x, y, z coordinates.
+
+        This is the profile's own storage, shared by the area and centroid
+        calculations, so treat it as read-only. After changing self.points in place,
+        call sort_points(), which rebuilds it.
+        """
+        if self._xyz_cache is None:
+            xyz = np.array([(p.x, p.y, p.z) for p in self._points], dtype=float)
+            self._xyz_cache = xyz.reshape(-1, 3)
+        return self._xyz_cache
+
+    def _yz(self) -> tuple[np.ndarray, np.ndarray]:
+        """Return the y and z coordinates of the points as arrays."""
+        xyz = self.as_array()
+        return xyz[:, 1], xyz[:, 2]
+
     def to_json(self) -> str:
         points_list = [{"x": p.x, "y": p.y, "z": p.z} for p in self.points]
         return {"points": points_list}
@@ -54,18 +124,23 @@ class Profile:
         This is necessary for the shoelace formula to work correctly.
         Points are sorted by their angle from the centroid in the y-z plane.
         """
-        if not self.points or len(self.points) < 3:
+        if self._points is not None:
+            self._xyz_cache = None  # self.points may have been changed in place
+        self._sort_by_angle()
+
+    def _sort_by_angle(self):
+        """Sort the coordinate array (and the points, if built) by angle around the centroid."""
+        xyz = self.as_array()
+        if len(xyz) < 3:
             return
+        y, z = xyz[:, 1], xyz[:, 2]
 
-        # Calculate centroid of points (simple average)
-        cy = sum(p.y for p in self.points) / len(self.points)
-        cz = sum(p.z for p in self.points) / len(self.points)
-
-        # Sort by angle from centroid (counterclockwise)
-        def angle_from_centroid(p):
-            return np.arctan2(p.z - cz, p.y - cy)
-
-        self.points.sort(key=angle_from_centroid)
+        # Sort by angle from centroid (simple average), counterclockwise.
+        # A pseudo-angle gives the same order as arctan2 without the trig.
+        order = np.argsort(_pseudo_angle(y - y.mean(), z - z.mean()), kind="stable")
+        if self._points is not None:
+            self._points = [self._points[i] for i in order.tolist()]
+        self._xyz_cache = xyz[order]
 
     def calculate_area(self) -> float:
         """Calculate the area of the profile using the shoelace formula.
@@ -81,8 +156,7 @@ class Profile:
             raise ValueError(f"Not all points lie in station plane x={self.station}")
 
         # Use y and z coordinates for 2D area calculation
-        y = np.array([p.y for p in self.points])
-        z = np.array([p.z for p in self.points])
+        y, z = self._yz()
 
         # Shoelace formula - always return positive area
         return 0.5 * np.abs(np.dot(y, np.roll(z, 1)) - np.dot(z, np.roll(y, 1)))
@@ -97,22 +171,14 @@ class Profile:
             return 0.0, 0.0
 
         # Calculate signed area (needed for centroid formula)
-        n = len(self.points)
-        signed_area = 0.0
-        cy = 0.0
-        cz = 0.0
-
-        for i in range(n):
-            j = (i + 1) % n  # Next point (wrapping around)
-            yi, zi = self.points[i].y, self.points[i].z
-            yj, zj = self.points[j].y, self.points[j].z
-
-            cross = yi * zj - yj * zi
-            signed_area += cross
-            cy += (yi + yj) * cross
-            cz += (zi + zj) * cross
+        y, z = self._yz()
+        y_next = np.roll(y, -1)  # Next point (wrapping around)
+        z_next = np.roll(z, -1)
 
-        signed_area *= 0.5
+        cross = y * z_next - y_next * z
+        signed_area = 0.5 * float(cross.sum())
+        cy = float(((y + y_next) * cross).sum())
+        cz = float(((z + z_next) * cross).sum())
 
         if abs(signed_area) < 1e-10:
             return 0.0, 0.0
@@ -156,17 +222,8 @@ class Profile:
         if not self.is_valid():
             return 0.0
 
-        perimeter = 0.0
-        n = len(self.points)
-
-        for i in range(n):
-            p1 = self.points[i]
-            p2 = self.points[(i + 1) % n]  # Next point (wrap around)
-
-            # Calculate Euclidean distance in y-z plane
-            dy = p2.y - p1.y
-            dz = p2.z - p1.z
-            distance = np.sqrt(dy * dy + dz * dz)
-            perimeter += distance
-
-        return perimeter
+        # Euclidean distances in the y-z plane to the next point (wrapping around)
+        y, z = self._yz()
+        dy = np.roll(y, -1) - y
+        dz = np.roll(z, -1) - z
+        return float(np.sqrt(dy * dy + dz * dz).sum())
@@ -1,4 +1,6 @@
+import math
 import numpy as np
+from bisect import bisect_right
 from typing import List
 from scipy.interpolate import CubicSpline, PchipInterpolator
 from scipy.optimize import brentq
@@ -28,30 +30,32 @@ class Spline3D:
 
         Creates a new spline with rotated points without modifying the original.
         """
-        angle_rad = np.radians(angle_degrees)
-        cos_a = np.cos(angle_rad)
-        sin_a = np.sin(angle_rad)
+        angle_rad = math.radians(angle_degrees)
+        cos_a = math.cos(angle_rad)
+        sin_a = math.sin(angle_rad)
 
-        rotated_points = []
-        for p in self.points:
-            # Translate point to origin
-            y = p.y - origin.y
-            z = p.z - origin.z
+        # Rotate all points at once using the coordinate arrays built in build()
+        # Translate points to origin
+        y = self.y - origin.y
+        z = self.z - origin.z
 
-            # Rotate around x-axis
-            y_new = y * cos_a - z * sin_a
-            z_new = y * sin_a + z * cos_a
+        # Rotate around x-axis and translate back
+        y_new = y * cos_a - z * sin_a + origin.y
+        z_new = y * sin_a + z * cos_a + origin.z
 
-            # Translate back and create new point
-            rotated_points.append(Point3D(p.x, y_new + origin.y, z_new + origin.z))
+        rotated_points = [
+            Point3D(px, py, pz)
+            for px, py, pz in zip(self.x.tolist(), y_new.tolist(), z_new.tolist())
+        ]
 
         return Spline3D(self.name, rotated_points, self.bc_type, self.parametrization)
 
     def build(self):
-        # Extract coordinate arrays
-        self.x = np.array([p.x for p in self.points])
-        self.y = np.array([p.y for p in self.points])
-        self.z = np.array([p.z for p in self.points])
+        # Extract coordinates once as an (n, 3) array; x, y and z are column views of it
+        self.xyz = np.array([(p.x, p.y, p.z) for p in self.points], dtype=float).reshape(-1, 3)
+        self.x = self.xyz[:, 0]
+        self.y = self.xyz[:, 1]
+        self.z = self.xyz[:, 2]
 
         # Determine parametrization
         x_increasing = np.all(np.diff(self.x) > 0)
@@ -87,6 +91,18 @@ class Spline3D:
             self.sy = CubicSpline(self.t, self.y, bc_type=self.bc_type)
             self.sz = CubicSpline(self.t, self.z, bc_type=self.bc_type)
 
+        if self.parametrization == "x":
+            # PCHIP is a piecewise cubic: keep its breakpoints and per-segment
+            # coefficients as plain lists so eval_x is a bisect plus two Horner sums
+            self._knots = self.sy.x.tolist()
+            self._coef_y = self.sy.c.T.tolist()
+            self._coef_z = self.sz.c.T.tolist()
+
+        # x range covered by the curve (x at its two ends), checked on every eval_x
+        x_start, x_end = float(self.sx(self.t[0])), float(self.sx(self.t[-1]))
+        self.x_min = min(x_start, x_end)
+        self.x_max = max(x_start, x_end)
+
     # ---------------------------------------------------------
     # Evaluate point at parameter t
     # ---------------------------------------------------------
@@ -104,19 +120,22 @@ class Spline3D:
         Return the 3D point corresponding to a given x coordinate.
         Requires x(t) to be monotonic.
         """
+        if not (self.x_min <= x_obj <= self.x_max):
+            raise ValueError("Requested x is outside the curve range")
+
         if self.parametrization == "x":
-            # Direct evaluation when parametrized by x
-            x_min, x_max = self.t[0], self.t[-1]
-            if not (min(x_min, x_max) <= x_obj <= max(x_min, x_max)):
-                raise ValueError("Requested x is outside the curve range")
-            return Point3D(x_obj, float(self.sy(x_obj)), float(self.sz(x_obj)))
+            # Direct evaluation when parametrized by x: locate the segment, then Horner
+            knots = self._knots
+            i = min(max(bisect_right(knots, x_obj) - 1, 0), len(knots) - 2)
+            t = x_obj - knots[i]
+            a, b, c, d = self._coef_y[i]
+            y = ((a * t + b) * t + c) * t + d
+            a, b, c, d = self._coef_z[i]
+            z = ((a * t + b) * t + c) * t + d
+            return Point3D(x_obj, float(y), float(z))
 
         t_min, t_max = self.t[0], self.t[-1]
 
-        x_min, x_max = self.sx(t_min), self.sx(t_max)
-        if not (min(x_min, x_max) <= x_obj <= max(x_min, x_max)):
-            raise ValueError("Requested x is outside the curve range")
-
         # Root-finding: solve sx(t) - x_obj = 0
         def f(tau):
             return self.sx(tau) - x_obj
@@ -125,6 +144,30 @@ class Spline3D:
 
         return self.eval_t(t_star)
 
+    def eval_x_batch(self, xs) -> np.ndarray:
+        """
+        Return the 3D points at several x coordinates as an (n, 3) array.
+        Rows for x values outside the curve range are NaN instead of raising.
+        """
+        xs = np.asarray(xs, dtype=float)
+        result = np.full((xs.size, 3), np.nan)
+        inside = (self.x_min <= xs) & (xs <= self.x_max)
+        if not inside.any():
+            return result
+
+        if self.parametrization == "x":
+            # One spline call per coordinate for all stations
+            x_in = xs[inside]
+            result[inside, 0] = x_in
+            result[inside, 1] = self.sy(x_in)
+            result[inside, 2] = self.sz(x_in)
+            return result
+
+        for i in np.flatnonzero(inside):
+            p = self.eval_x(xs[i])
+            result[i] = (p.x, p.y, p.z)
+        return result
+
     # ---------------------------------------------------------
     # Tangent vector
     # ---------------------------------------------------------
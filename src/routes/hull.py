@@ -3,7 +3,7 @@ from typing import List
 import numpy as np
 
 from fastapi import APIRouter, HTTPException
-from src.analysis.stability import create_stability_curve_points
+from src.analysis.stability import calculate_stability
 from src.analysis.resistance import (
     calculate_resistance_curve,
     calculate_hull_speed,
@@ -260,29 +260,38 @@ def calculate_hull_stability(
         hull_model = HullModel.model_validate_json(hull_data)
         hull = Hull()
         hull.initialize_from_data(hull_model.model_dump())
-    vanishing_angle, max_moment, max_moment_angle, stability_points = create_stability_curve_points(
-        hull,
-        paddler_cg_z=stability_analysis.paddler_cg_z,
-        paddler_weight=stability_analysis.paddler_weight,
-        hull_weight=stability_analysis.hull_weight,
-        max_angle=stability_analysis.max_angle,
-        step=stability_analysis.step,
-        break_on_vanishing=stability_analysis.break_on_vanishing,
-    )
+    try:
+        stability = calculate_stability(
+            hull,
+            paddler_cg_z=stability_analysis.paddler_cg_z,
+            paddler_weight=stability_analysis.paddler_weight,
+            hull_weight=stability_analysis.hull_weight,
+            max_angle=stability_analysis.max_angle,
+            step=stability_analysis.step,
+            break_on_vanishing=stability_analysis.break_on_vanishing,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     result = StabilityAnalysisResultModel(
-        vanishing_angle=vanishing_angle,
-        max_moment=max_moment,
-        max_moment_angle=max_moment_angle,
+        vanishing_angle=stability.vanishing_angle,
+        max_moment=stability.max_moment,
+        max_moment_angle=stability.max_moment_angle,
     )
 
-    for point in stability_points:
+    for angle, gz, moment, waterline, displacement in zip(
+        stability.angle.tolist(),
+        stability.gz.tolist(),
+        stability.moment.tolist(),
+        stability.waterline.tolist(),
+        stability.displacement.tolist(),
+    ):
         result.stability_points.append(
             StabilityPointModel(
-                angle=point["angle"],
-                gz=point["gz"],
-                moment=point["moment"],
-                waterline=point["waterline"],
-                displacement=point["displacement"],
+                angle=angle,
+                gz=gz,
+                moment=moment,
+                waterline=waterline,
+                displacement=displacement,
             )
         )
 
@@ -1,7 +1,7 @@
 """Unit tests for the Hull class in geometry.hull module."""
 
 import pytest
-from src.geometry.hull import Hull, WaterlineCalculationError
+from src.geometry.hull import Hull, WaterlineCalculationError, _station_grid
 from src.geometry.point import Point3D
 from src.geometry.curve import Curve
 
@@ -19,6 +19,16 @@ class TestHullInit:
         assert len(hull.curves) == 0
         assert len(hull.profiles) == 0
 
+    def test_init_state_is_per_instance(self):
+        """Test that hulls do not share curves and start with empty bounds."""
+        first = Hull()
+        second = Hull()
+        first._add_spline(Curve("keel", [Point3D(0, 0, 0), Point3D(1, 0, 0.1)]))
+
+        assert len(second.curves) == 0
+        assert second.min_x == float("inf")
+        assert second.max_x == float("-inf")
+
 
 class TestHullInitializeFromData:
     """Tests for initialize_from_data method."""
@@ -168,100 +178,40 @@ class TestHullDimensions:
         assert hull.depth() == 0.4
 
 
-class TestHullUpdateMinMax:
-    """Tests for _update_min_max method."""
+class TestHullSetBoundsFromCurves:
+    """Tests for _set_bounds_from_curves method."""
 
-    def test_update_min_max_first_point(self):
-        """Test _update_min_max with first point."""
+    def test_set_bounds_no_curves(self):
+        """Test that a hull without curves keeps empty bounds."""
         hull = Hull()
-        hull.min_x = float("inf")
-        hull.max_x = float("-inf")
-        hull.min_y = float("inf")
-        hull.max_y = float("-inf")
-        hull.min_z = float("inf")
-        hull.max_z = float("-inf")
-
-        point = Point3D(1.0, 2.0, 3.0)
-        hull._update_min_max(point)
-
-        assert hull.min_x == 1.0
-        assert hull.max_x == 1.0
-        assert hull.min_y == 2.0
-        assert hull.max_y == 2.0
-        assert hull.min_z == 3.0
-        assert hull.max_z == 3.0
-
-    def test_update_min_max_expands_bounds(self):
-        """Test _update_min_max expands bounds correctly."""
-        hull = Hull()
-        hull.min_x = 1.0
-        hull.max_x = 2.0
-        hull.min_y = 0.0
-        hull.max_y = 1.0
-        hull.min_z = 0.0
-        hull.max_z = 1.0
+        hull._set_bounds_from_curves()
 
-        # Point outside current bounds
-        point = Point3D(3.0, 2.0, 2.0)
-        hull._update_min_max(point)
+        assert hull.min_x == float("inf")
+        assert hull.max_x == float("-inf")
+        assert hull.min_z == float("inf")
+        assert hull.max_z == float("-inf")
 
-        assert hull.max_x == 3.0
-        assert hull.max_y == 2.0
-        assert hull.max_z == 2.0
-
-    def test_update_min_max_negative_values(self):
-        """Test _update_min_max with negative values."""
+    def test_set_bounds_spans_all_curves(self):
+        """Test that bounds cover the points of every curve."""
         hull = Hull()
-        hull.min_x = 0.0
-        hull.max_x = 1.0
-        hull.min_y = 0.0
-        hull.max_y = 1.0
-        hull.min_z = 0.0
-        hull.max_z = 1.0
+        hull._add_spline(Curve("keel", [Point3D(0.0, 0.0, 0.0), Point3D(2.0, 0.0, 0.1)]))
+        hull._add_spline(Curve("chine", [Point3D(0.5, 0.3, 0.2), Point3D(3.0, 0.2, 0.4)]))
+        hull._set_bounds_from_curves()
 
-        point = Point3D(-1.0, -0.5, -0.2)
-        hull._update_min_max(point)
+        assert (hull.min_x, hull.max_x) == (0.0, 3.0)
+        assert (hull.min_y, hull.max_y) == (0.0, 0.3)
+        assert (hull.min_z, hull.max_z) == (0.0, 0.4)
+
+    def test_set_bounds_negative_values(self):
+        """Test bounds with negative coordinates."""
+        hull = Hull()
+        hull._add_spline(Curve("port", [Point3D(-1.0, -0.5, -0.2), Point3D(1.0, -0.1, 0.3)]))
+        hull._set_bounds_from_curves()
 
         assert hull.min_x == -1.0
         assert hull.min_y == -0.5
         assert hull.min_z == -0.2
-
-
-class TestHullGetPointsAt:
-    """Tests for _get_points_at method."""
-
-    def test_get_points_at_no_curves(self):
-        """Test _get_points_at with no curves."""
-        hull = Hull()
-        points = hull._get_points_at(1.0)
-        assert points == []
-
-    def test_get_points_at_with_curves(self):
-        """Test _get_points_at with valid curves."""
-        hull = Hull()
-        # Create a simple curve
-        curve_points = [Point3D(0, 0, 0), Point3D(2, 0.5, 0.3)]
-        curve = Curve("test", curve_points)
-        hull.curves.append(curve)
-
-        # Get points at x=1.0 (midpoint)
-        points = hull._get_points_at(1.0)
-
-        # Should get one point from the curve
-        assert len(points) >= 1
-
-    def test_get_points_at_outside_range(self):
-        """Test _get_points_at with x outside curve range."""
-        hull = Hull()
-        curve_points = [Point3D(0, 0, 0), Point3D(1, 0.5, 0.3)]
-        curve = Curve("test", curve_points)
-        hull.curves.append(curve)
-
-        # Request x outside range
-        points = hull._get_points_at(5.0)
-
-        # Should return empty list when no curves can provide a point
-        assert len(points) == 0
+        assert hull.max_y == -0.1
 
 
 class TestHullGetPointsBelowWaterline:
@@ -351,6 +301,21 @@ class TestHullAsDict:
         assert "name" in result
         assert result["name"] == "Test Kayak"
 
+    def test_as_summary_dict_has_only_scalars(self):
+        """Test that as_summary_dict leaves out curves and profiles."""
+        hull = Hull()
+        hull.name = "Test Kayak"
+        hull.cg = Point3D(1.0, 0.0, 0.2)
+        hull._add_spline(Curve("keel", [Point3D(0, 0, 0), Point3D(1, 0, 0.1)]))
+        result = hull.as_summary_dict()
+
+        assert result["name"] == "Test Kayak"
+        assert result["cg"] == (1.0, 0.0, 0.2)
+        assert result["cb"] is None
+        assert result["volume"] is None
+        assert "curves" not in result
+        assert "profiles" not in result
+
 
 class TestHullBuildIntegration:
     """Integration tests for build method."""
@@ -549,6 +514,144 @@ class TestHullBuildIntegration:
             hull.build(data)
 
 
+class TestHullHeeledWaterline:
+    """Tests for the heeled waterline solve."""
+
+    def test_rotation_matches_angle(self):
+        """Test that passing the angle's (cos, sin) gives the same waterline as the angle."""
+        import math
+
+        data = {
+            "name": "Test",
+            "target_waterline": 0.1,
+            "target_weight": 5.0,
+            "target_payload": 20.0,
+            "curves": [
+                {"name": "keel", "points": [[0.0, 0.0, 0.0], [1.0, 0.0, 0.05], [2.0, 0.0, 0.0]]},
+                {"name": "gunwale", "points": [[0.0, 0.2, 0.4], [1.0, 0.35, 0.3], [2.0, 0.2, 0.4]]},
+            ],
+        }
+        hull = Hull()
+        hull.build(data)
+
+        angle = 20.0
+        rotation = (math.cos(math.radians(angle)), math.sin(math.radians(angle)))
+        waterline, cb, displacement = hull._calculate_waterline(25.0, angle=angle)
+        waterline_r, cb_r, displacement_r = hull._calculate_waterline(
+            25.0, angle=angle, rotation=rotation
+        )
+
+        assert waterline_r == pytest.approx(waterline)
+        assert cb_r == cb
+        assert displacement_r == pytest.approx(displacement)
+
+    def test_heeled_stations_rotate_upright_samples(self):
+        """Test that heeled station samples are the upright samples rotated about the CG."""
+        data = {
+            "name": "Test",
+            "target_waterline": 0.1,
+            "target_weight": 5.0,
+            "target_payload": 20.0,
+            "curves": [
+                {"name": "keel", "points": [[0.0, 0.0, 0.0], [1.0, 0.0, 0.05], [2.0, 0.0, 0.0]]},
+                {"name": "gunwale", "points": [[0.0, 0.2, 0.4], [1.0, 0.35, 0.3], [2.0, 0.2, 0.4]]},
+            ],
+        }
+        hull = Hull()
+        hull.build(data)
+        upright = hull._heeled_stations(0.5, 0.0)
+        heeled = hull._heeled_stations(0.5, 25.0)
+
+        assert [x for x, _ in heeled] == [x for x, _ in upright]
+        for (_, up), (_, rot) in zip(upright, heeled):
+            for p, q in zip(up, rot):
+                expected = (Point3D(*p) - hull.cg).rotate_x(25.0) + hull.cg
+                assert q == pytest.approx([expected.x, expected.y, expected.z])
+
+    def test_converges_from_poor_initial_waterline(self):
+        """Test that the solve meets the 1 kg tolerance from far-off starting waterlines."""
+        data = {
+            "name": "Test",
+            "target_waterline": 0.1,
+            "target_weight": 5.0,
+            "target_payload": 20.0,
+            "curves": [
+                {"name": "keel", "points": [[0.0, 0.0, 0.0], [1.0, 0.0, 0.05], [2.0, 0.0, 0.0]]},
+                {"name": "gunwale", "points": [[0.0, 0.2, 0.4], [1.0, 0.35, 0.3], [2.0, 0.2, 0.4]]},
+            ],
+        }
+        hull = Hull()
+        hull.build(data)
+
+        for initial_waterline in (0.05, 0.35):
+            _, _, displacement = hull._calculate_waterline(
+                25.0, angle=10.0, initial_waterline=initial_waterline
+            )
+            assert displacement == pytest.approx(25.0, abs=1.0)
+
+    def test_converges_when_first_step_overshoots_deck(self):
+        """Test that a step past the deck is clamped back into the hull when a root exists."""
+        # V-section hull: displacement grows with z², so from 0.3 m the first step
+        # lands above the 0.4 m deck although 220 kg floats below it
+        data = {
+            "name": "V",
+            "target_waterline": 0.1,
+            "target_weight": 5.0,
+            "target_payload": 20.0,
+            "curves": [
+                {"name": "keel", "points": [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [2.0, 0.0, 0.0]]},
+                {"name": "gunwale", "points": [[0.0, 0.3, 0.4], [1.0, 0.3, 0.4], [2.0, 0.3, 0.4]]},
+            ],
+        }
+        hull = Hull()
+        hull.build(data)
+
+        for initial_waterline in (0.3, 0.35):
+            waterline, _, displacement = hull._calculate_waterline(
+                220.0, initial_waterline=initial_waterline
+            )
+            assert 0 < waterline <= hull.depth()
+            assert displacement == pytest.approx(220.0, abs=1.0)
+
+
+class TestStationGrid:
+    """Tests for the _station_grid helper."""
+
+    def test_station_grid_includes_end_despite_float_step(self):
+        """Test that max_x is included once even when a running sum would overshoot it."""
+        # 0.1 + 0.1 + 0.1 == 0.30000000000000004 > 0.3
+        assert _station_grid(0.0, 0.3, 0.1) == pytest.approx([0.0, 0.1, 0.2, 0.3])
+        assert _station_grid(0.0, 0.3, 0.1)[-1] == 0.3
+        assert len(_station_grid(0.0, 5.0, 0.05)) == 101
+
+    def test_station_grid_empty_range(self):
+        """Test that an empty or inverted range has no stations."""
+        assert _station_grid(float("inf"), float("-inf"), 0.05) == []
+        assert _station_grid(1.0, 0.0, 0.05) == []
+
+
+class TestHullStationCache:
+    """Tests for the cached upright station samples."""
+
+    def test_upright_stations_cached_until_curves_change(self):
+        """Test that station samples are reused per step and rebuilt when curves change."""
+        hull = Hull()
+        for name, y in (("keel", 0.0), ("port", 0.3), ("starboard", -0.3)):
+            hull._add_spline(
+                Curve(name, [Point3D(0, y, 0.1), Point3D(1, y, 0.0), Point3D(2, y, 0.1)])
+            )
+        hull._set_bounds_from_curves()
+
+        stations = hull._upright_stations(0.5)
+        assert hull._upright_stations(0.5) is stations
+        assert not stations[0][1].flags.writeable
+
+        hull._add_spline(Curve("deck", [Point3D(0, 0, 0.4), Point3D(2, 0, 0.4)]))
+        rebuilt = hull._upright_stations(0.5)
+        assert rebuilt is not stations
+        assert all(len(pts) == 4 for _, pts in rebuilt)
+
+
 class TestHullWettedSurfaceArea:
     """Tests for wetted_surface_area method."""
 
@@ -869,6 +972,49 @@ class TestHullWaterlineBeam:
             hull.waterline_beam()
 
 
+class TestHullWaterplaneAndSection:
+    """Tests for waterplane_area and max_section_area methods."""
+
+    def _build_hull(self):
+        data = {
+            "name": "Test Kayak",
+            "curves": [
+                {"name": "keel", "points": [[0, 0, 0], [2.5, 0, 0.05], [5, 0, 0]]},
+                {
+                    "name": "starboard_chine",
+                    "points": [[0, 0.2, 0.05], [2.5, 0.4, 0.15], [5, 0.2, 0.05]],
+                },
+                {
+                    "name": "starboard_gunnel",
+                    "points": [[0, 0.25, 0.15], [2.5, 0.5, 0.25], [5, 0.25, 0.15]],
+                },
+            ],
+            "weights": [{"name": "test", "weight": 75, "position": [2.5, 0, 0.1]}],
+        }
+        hull = Hull()
+        hull.build(data)
+        return hull
+
+    def test_waterplane_area_within_waterline_rectangle(self):
+        """Test waterplane area is positive and inside the LWL x BWL rectangle."""
+        hull = self._build_hull()
+        awp = hull.waterplane_area()
+        assert 0 < awp < hull.waterline_length() * hull.waterline_beam()
+
+    def test_max_section_area_grows_with_waterline(self):
+        """Test the largest submerged section grows as the hull sinks deeper."""
+        hull = self._build_hull()
+        assert 0 < hull.max_section_area(0.08) < hull.max_section_area(0.15)
+
+    def test_invalid_waterline_raises(self):
+        """Test both methods reject a missing or non-positive waterline."""
+        hull = Hull()
+        with pytest.raises(ValueError):
+            hull.waterplane_area()
+        with pytest.raises(ValueError):
+            hull.max_section_area(waterline=0.0)
+
+
 class TestHullMainProfiles:
     """Tests for main_profiles feature and _get_main_profiles method."""
 
@@ -1,7 +1,9 @@
 """Unit tests for the Profile class in geometry.profile module."""
 
+import math
+import numpy as np
 import pytest
-from src.geometry.profile import Profile
+from src.geometry.profile import Profile, _pseudo_angle
 from src.geometry.point import Point3D
 
 
@@ -38,6 +40,39 @@ class TestProfileInit:
         profile = Profile(station=1.0, points=points)
         assert len(profile.points) == 2
 
+    def test_init_removes_near_duplicate_points(self):
+        """Test that points within np.isclose tolerance count as duplicates of the first one."""
+        first = Point3D(1.0, 0.0, 0.5)
+        points = [
+            first,
+            Point3D(1.0, 0.5, 0.3),
+            Point3D(1.0, 1e-9, 0.5 + 1e-9),  # Near-duplicate of the first point
+            Point3D(1.0, -0.5, 0.3),
+        ]
+        profile = Profile(station=1.0, points=points)
+        assert len(profile.points) == 3
+        assert any(p is first for p in profile.points)
+
+    def test_init_from_array_matches_point_list(self):
+        """Test that an (n, 3) array builds the same profile as the equivalent Point3D list."""
+        xyz = np.array(
+            [[1.0, 0.0, 1.0], [1.0, 1.0, 0.0], [1.0, 0.0, 1.0], [1.0, -1.0, 0.0], [1.0, 0.0, -1.0]]
+        )
+        from_array = Profile(station=1.0, points=xyz)
+        from_points = Profile(station=1.0, points=[Point3D(*row) for row in xyz])
+
+        assert from_array.points == from_points.points
+        assert np.array_equal(from_array.as_array(), from_points.as_array())
+        assert from_array.calculate_area() == pytest.approx(2.0)
+
+    def test_points_setter_resets_coordinate_array(self):
+        """Test that assigning points rebuilds the coordinate array from the new points."""
+        profile = Profile(station=1.0, points=np.array([[1.0, 0.0, 0.0], [1.0, 1.0, 0.0]]))
+        profile.points = [Point3D(1.0, 2.0, 3.0)]
+
+        assert profile.as_array().tolist() == [[1.0, 2.0, 3.0]]
+        assert not profile.is_valid()
+
     def test_init_sorts_points(self):
         """Test that initialization sorts points."""
         points = [
@@ -195,6 +230,25 @@ class TestProfileSortPoints:
         # We can't predict exact order without calculating angles, but verify no crash
         assert len(profile.points) == 4
 
+    def test_sort_points_matches_polar_angle_order(self):
+        """Test that the pseudo-angle sort gives the same order as sorting by atan2."""
+        points = [
+            Point3D(1.0, math.cos(a), 0.5 * math.sin(a)) for a in (2.5, -0.3, 1.0, -2.8, 0.0, 3.1)
+        ]
+        profile = Profile(station=1.0, points=points)
+
+        cy = sum(p.y for p in points) / len(points)
+        cz = sum(p.z for p in points) / len(points)
+        expected = sorted(points, key=lambda p: math.atan2(p.z - cz, p.y - cy))
+        assert profile.points == expected
+
+    def test_pseudo_angle_is_monotonic(self):
+        """Test that _pseudo_angle increases with the polar angle over (-pi, pi]."""
+        angles = np.linspace(-math.pi + 1e-3, math.pi, 50)
+        keys = _pseudo_angle(np.cos(angles), np.sin(angles))
+        assert np.all(np.diff(keys) > 0)
+        assert _pseudo_angle(np.array([0.0]), np.array([0.0]))[0] == 0.0
+
 
 class TestProfileCalculateArea:
     """Tests for calculate_area method."""
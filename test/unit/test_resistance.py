@@ -22,6 +22,7 @@ from src.analysis.resistance import (
     calculate_paddler_power,
     calculate_resistance,
     calculate_resistance_curve,
+    calculate_cruise_speed_for_power,
     calculate_energy_for_distance,
     # Data class
     ResistanceResult,
@@ -76,6 +77,20 @@ def test_reynolds_number_invalid_viscosity():
         calculate_reynolds_number(speed=2.0, waterline_length=5.0, kinematic_viscosity=-1e-6)
 
 
+def test_reynolds_number_accepts_array():
+    """Test Reynolds number is computed element-wise for an array of speeds."""
+    import numpy as np
+
+    speeds = np.array([0.0, 1.0, 2.0])
+    re = calculate_reynolds_number(speed=speeds, waterline_length=5.0)
+    assert re.shape == speeds.shape
+    for i, v in enumerate(speeds):
+        assert re[i] == pytest.approx(calculate_reynolds_number(speed=v, waterline_length=5.0))
+
+    with pytest.raises(ValueError, match="Speed must be non-negative"):
+        calculate_reynolds_number(speed=np.array([1.0, -1.0]), waterline_length=5.0)
+
+
 # ============================================================================
 # Test Froude Number Calculation
 # ============================================================================
@@ -167,6 +182,19 @@ def test_hull_speed_invalid_length():
         calculate_hull_speed(-5.0)
 
 
+def test_hull_speed_is_memoized():
+    """Test hull speed is cached per (waterline_length, gravity) pair."""
+    calculate_hull_speed.cache_clear()
+    v1 = calculate_hull_speed(5.0)
+    v2 = calculate_hull_speed(5.0)
+    assert v1 == v2
+    assert calculate_hull_speed.cache_info().hits == 1
+
+    # Non-default gravity is part of the cache key
+    v_moon = calculate_hull_speed(5.0, gravity=1.62)
+    assert v_moon < v1
+
+
 # ============================================================================
 # Test ITTC Friction Coefficient Calculation
 # ============================================================================
@@ -283,6 +311,25 @@ def test_frictional_resistance_invalid_inputs():
         calculate_frictional_resistance(2.0, 2.5, 0.003, water_density=0.0)
 
 
+def test_resistance_helpers_accept_arrays():
+    """Test the leaf helpers compose element-wise over an array of speeds."""
+    import numpy as np
+
+    speeds = np.array([0.5, 1.5, 2.5, 3.5])
+    fn = calculate_froude_number(speeds, 5.0)
+    re = calculate_reynolds_number(speeds, 5.0)
+    cf = calculate_ittc_friction_coefficient(re)
+    rf = calculate_frictional_resistance(speeds, 2.5, cf)
+    rr = calculate_residuary_resistance(speeds, 2.5, np.full_like(speeds, 0.0005))
+
+    for i, v in enumerate(speeds):
+        assert fn[i] == pytest.approx(calculate_froude_number(v, 5.0))
+        cf_i = calculate_ittc_friction_coefficient(calculate_reynolds_number(v, 5.0))
+        assert cf[i] == pytest.approx(cf_i)
+        assert rf[i] == pytest.approx(calculate_frictional_resistance(v, 2.5, cf_i))
+        assert rr[i] == pytest.approx(calculate_residuary_resistance(v, 2.5, 0.0005))
+
+
 # ============================================================================
 # Test Residuary Coefficient Calculation
 # ============================================================================
@@ -353,6 +400,27 @@ def test_residuary_coefficient_zero_negative_froude():
     assert cr_neg >= 0.0
 
 
+def test_residuary_coefficient_non_negative_sweep():
+    """Test residuary coefficient is non-negative over a dense Fn/Cp sweep."""
+    import numpy as np
+
+    for cp in [None, *np.linspace(0.3, 0.9, 13)]:
+        for fn in np.linspace(0.0, 1.5, 301):
+            assert calculate_residuary_coefficient(fn, cp) >= 0.0
+
+
+def test_residuary_coefficient_accepts_arrays():
+    """Test an array of Froude numbers gives the scalar Cr element-wise, in every regime."""
+    import numpy as np
+
+    fn = np.array([-0.1, 0.0, 0.25, 0.30, 0.35, 0.40, 0.50, 0.80])
+    for cp in [None, 0.60]:
+        cr = calculate_residuary_coefficient(fn, cp)
+        assert cr.shape == fn.shape
+        for i, f in enumerate(fn):
+            assert cr[i] == calculate_residuary_coefficient(float(f), cp)
+
+
 # ============================================================================
 # Test Residuary Resistance Calculation
 # ============================================================================
@@ -579,12 +647,71 @@ def test_calculate_resistance_curve():
         assert results[i + 1].paddler_power > results[i].paddler_power
 
 
+def test_calculate_resistance_curve_matches_pointwise():
+    """Test the vectorized curve matches calculate_resistance speed by speed."""
+    speeds = [0.0, 0.8, 1.6, 2.4, 3.2, 4.0]
+    results = calculate_resistance_curve(
+        speed_range=speeds,
+        waterline_length=5.0,
+        wetted_surface=2.5,
+        prismatic_coefficient=0.58,
+        water_density=WATER_DENSITY_SALT,
+    )
+
+    for speed, result in zip(speeds, results):
+        expected = calculate_resistance(
+            speed=speed,
+            waterline_length=5.0,
+            wetted_surface=2.5,
+            prismatic_coefficient=0.58,
+            water_density=WATER_DENSITY_SALT,
+        )
+        assert result.total_resistance == pytest.approx(expected.total_resistance)
+        assert result.residuary_coefficient == pytest.approx(expected.residuary_coefficient)
+        assert result.friction_coefficient == pytest.approx(expected.friction_coefficient)
+        assert result.paddler_power == pytest.approx(expected.paddler_power)
+
+
+def test_calculate_resistance_curve_invalid_inputs():
+    """Test resistance curve validates its inputs once up front."""
+    with pytest.raises(ValueError, match="Speed must be non-negative"):
+        calculate_resistance_curve([1.0, -0.5], waterline_length=5.0, wetted_surface=2.5)
+    with pytest.raises(ValueError, match="Wetted surface must be positive"):
+        calculate_resistance_curve([1.0, 2.0], waterline_length=5.0, wetted_surface=0.0)
+    with pytest.raises(ValueError, match="Propulsion efficiency must be in range"):
+        calculate_resistance_curve(
+            [1.0, 2.0], waterline_length=5.0, wetted_surface=2.5, propulsion_efficiency=1.5
+        )
+
+
 def test_calculate_resistance_curve_empty():
     """Test resistance curve with empty speed range."""
     results = calculate_resistance_curve(speed_range=[], waterline_length=5.0, wetted_surface=2.5)
     assert len(results) == 0
 
 
+def test_cruise_speed_for_power_inverts_curve():
+    """Test cruise speed lookup recovers the speed for a known paddler power."""
+    speeds = [0.5 + 0.1 * i for i in range(36)]
+    results = calculate_resistance_curve(speeds, waterline_length=5.0, wetted_surface=2.5)
+    power = [r.paddler_power for r in results]
+
+    # Exact curve points map back to their speed
+    assert calculate_cruise_speed_for_power(power[10], speeds, power) == pytest.approx(speeds[10])
+
+    # Array targets are answered in one call and increase with power
+    cruise = calculate_cruise_speed_for_power([50.0, 100.0, 150.0], speeds, power)
+    assert cruise[0] < cruise[1] < cruise[2]
+    target = calculate_resistance(cruise[1], waterline_length=5.0, wetted_surface=2.5)
+    assert target.paddler_power == pytest.approx(100.0, rel=0.01)
+
+
+def test_cruise_speed_for_power_invalid_curve():
+    """Test cruise speed lookup rejects mismatched curve arrays."""
+    with pytest.raises(ValueError, match="equal length"):
+        calculate_cruise_speed_for_power(100.0, [1.0, 2.0], [10.0])
+
+
 # ============================================================================
 # Test Energy for Distance Calculation
 # ============================================================================
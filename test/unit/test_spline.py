@@ -44,6 +44,7 @@ class TestSpline3DInit:
         np.testing.assert_array_equal(spline.x, np.array([0, 3, 6]))
         np.testing.assert_array_equal(spline.y, np.array([1, 4, 7]))
         np.testing.assert_array_equal(spline.z, np.array([2, 5, 8]))
+        np.testing.assert_array_equal(spline.xyz, np.arange(9).reshape(3, 3))
 
 
 class TestSpline3DEvalT:
@@ -104,6 +105,17 @@ class TestSpline3DEvalX:
         with pytest.raises(ValueError, match="outside the curve range"):
             spline.eval_x(3)
 
+    def test_x_range_decreasing_curve(self):
+        """Test the cached x range of a curve defined from bow to stern."""
+        points = [Point3D(2, 0, 0), Point3D(1, 1, 1), Point3D(0, 0, 2)]
+        spline = Spline3D("test", points, parametrization="x")
+
+        assert spline.x_min == pytest.approx(0.0)
+        assert spline.x_max == pytest.approx(2.0)
+        assert spline.eval_x(0.5).x == pytest.approx(0.5)
+        with pytest.raises(ValueError, match="outside the curve range"):
+            spline.eval_x(2.5)
+
     def test_eval_x_interpolates(self):
         """Test eval_x provides interpolation between points."""
         points = [Point3D(0, 0, 0), Point3D(2, 2, 2)]
@@ -115,6 +127,32 @@ class TestSpline3DEvalX:
         assert 0 <= p_mid.y <= 2
         assert 0 <= p_mid.z <= 2
 
+    def test_eval_x_matches_pchip(self):
+        """Test that eval_x's cached segment evaluation matches the PCHIP interpolators."""
+        points = [Point3D(3, 0, 0), Point3D(2, 1, 0.5), Point3D(1, 0.2, 1), Point3D(0, 0, 0.4)]
+        spline = Spline3D("test", points, parametrization="x")
+
+        for x in np.linspace(0.0, 3.0, 31):
+            p = spline.eval_x(x)
+            assert p.y == pytest.approx(float(spline.sy(x)), abs=1e-12)
+            assert p.z == pytest.approx(float(spline.sz(x)), abs=1e-12)
+
+    def test_eval_x_batch_matches_eval_x(self):
+        """Test eval_x_batch matches eval_x inside the range and is NaN outside."""
+        points = [Point3D(0, 0, 0), Point3D(1, 1, 0.5), Point3D(2, 0, 1)]
+        xs = [-0.5, 0.0, 0.75, 2.0, 2.5]
+
+        for parametrization in ("x", "chord"):
+            spline = Spline3D("test", points, parametrization=parametrization)
+            result = spline.eval_x_batch(xs)
+
+            assert result.shape == (5, 3)
+            assert np.isnan(result[0]).all()
+            assert np.isnan(result[4]).all()
+            for x, row in zip(xs[1:4], result[1:4]):
+                p = spline.eval_x(x)
+                assert row == pytest.approx([p.x, p.y, p.z])
+
 
 class TestSpline3DTangent:
     """Tests for tangent method."""
@@ -1,7 +1,14 @@
 """Unit tests for the stability module in analysis.stability."""
 
 import pytest
-from src.analysis.stability import calculate_combined_cg, create_stability_curve_points, GRAVITY
+from src.analysis.stability import (
+    calculate_combined_cg,
+    calculate_stability,
+    create_stability_curve_points,
+    StabilityResult,
+    GRAVITY,
+    _angle_grid,
+)
 from src.geometry.hull import Hull
 from src.geometry.point import Point3D
 
@@ -228,6 +235,89 @@ class TestCreateStabilityCurvePointsBasic:
             assert diff == pytest.approx(10.0, abs=1e-6)
 
 
+class TestCalculateStability:
+    """Tests for the column-wise calculate_stability result."""
+
+    def test_result_matches_legacy_points(self):
+        """Test that the result columns match the per-angle dicts of the wrapper."""
+        data = {
+            "name": "Test",
+            "target_waterline": 0.1,
+            "target_weight": 5.0,
+            "target_payload": 20.0,
+            "curves": [
+                {"name": "keel", "points": [[0.0, 0.0, 0.0], [1.0, 0.0, 0.05], [2.0, 0.0, 0.0]]},
+                {"name": "gunwale", "points": [[0.0, 0.2, 0.4], [1.0, 0.35, 0.3], [2.0, 0.2, 0.4]]},
+            ],
+        }
+        hull = Hull()
+        hull.build(data)
+
+        result = calculate_stability(hull, paddler_cg_z=0.25, max_angle=30, step=15)
+        _, _, _, stability_points = create_stability_curve_points(
+            hull, paddler_cg_z=0.25, max_angle=30, step=15
+        )
+
+        assert isinstance(result, StabilityResult)
+        assert len(result.angle) == len(stability_points)
+        assert result.points() == stability_points
+        for i, point in enumerate(stability_points):
+            assert result.gz[i] == pytest.approx(point["gz"])
+            assert result.angle[i] == pytest.approx(point["angle"])
+
+    def test_zero_paddler_weight_is_used(self):
+        """Test that a paddler weight of 0 is not replaced by the hull's target payload."""
+        data = {
+            "name": "Test",
+            "target_waterline": 0.1,
+            "target_weight": 5.0,
+            "target_payload": 20.0,
+            "curves": [
+                {"name": "keel", "points": [[0.0, 0.0, 0.0], [1.0, 0.0, 0.05], [2.0, 0.0, 0.0]]},
+                {"name": "gunwale", "points": [[0.0, 0.2, 0.4], [1.0, 0.35, 0.3], [2.0, 0.2, 0.4]]},
+            ],
+        }
+        hull = Hull()
+        hull.build(data)
+
+        result = calculate_stability(
+            hull, paddler_weight=0.0, hull_weight=25.0, max_angle=30, step=15
+        )
+
+        # Total weight is the hull alone; the payload default (20 kg) must not be added
+        for gz, moment in zip(result.gz, result.moment):
+            assert moment == pytest.approx(25.0 * GRAVITY * gz)
+
+    def test_angle_grid_includes_endpoint_once(self):
+        """Test that a float step yields exactly one sample per multiple up to max_angle."""
+        angles, cos_a, sin_a = _angle_grid(90, 3)
+        assert len(angles) == 31
+        assert angles[-1] == pytest.approx(90.0)
+
+        angles, _, _ = _angle_grid(1.0, 0.1)
+        assert len(angles) == 11
+        assert angles[-1] == pytest.approx(1.0)
+
+    def test_invalid_angle_range_raises(self):
+        """Test that a non-positive step or a negative max angle is rejected up front."""
+        data = {
+            "name": "Test",
+            "target_waterline": 0.1,
+            "target_weight": 5.0,
+            "target_payload": 20.0,
+            "curves": [
+                {"name": "keel", "points": [[0.0, 0.0, 0.0], [1.0, 0.0, 0.05], [2.0, 0.0, 0.0]]},
+                {"name": "gunwale", "points": [[0.0, 0.2, 0.4], [1.0, 0.35, 0.3], [2.0, 0.2, 0.4]]},
+            ],
+        }
+        hull = Hull()
+        hull.build(data)
+
+        for max_angle, step in ((90, -3), (90, 0), (-10, 3)):
+            with pytest.raises(ValueError):
+                calculate_stability(hull, max_angle=max_angle, step=step)
+
+
 class TestCreateStabilityCurvePointsPhysics:
     """Tests for physical correctness of stability calculations."""
 
@@ -279,6 +369,39 @@ class TestCreateStabilityCurvePointsPhysics:
             expected_moment = total_weight * GRAVITY * point["gz"]
             assert point["moment"] == pytest.approx(expected_moment, abs=1e-6)
 
+    def test_max_moment_matches_points(self):
+        """Test max moment and its angle agree with the returned stability points."""
+        data = {
+            "name": "Test",
+            "target_waterline": 0.1,
+            "target_weight": 5.0,
+            "target_payload": 20.0,
+            "curves": [
+                {"name": "keel", "points": [[0.0, 0.0, 0.0], [1.0, 0.0, 0.05], [2.0, 0.0, 0.0]]},
+                {"name": "gunwale", "points": [[0.0, 0.2, 0.4], [1.0, 0.35, 0.3], [2.0, 0.2, 0.4]]},
+            ],
+        }
+        hull = Hull()
+        hull.build(data)
+
+        vanishing_angle, max_moment, max_moment_angle, stability_points = (
+            create_stability_curve_points(hull, paddler_cg_z=0.25, max_angle=60, step=20)
+        )
+
+        # Only points before stability vanishes count, and the upright point is excluded
+        candidates = [
+            p
+            for p in stability_points[1:]
+            if vanishing_angle is None or p["angle"] < vanishing_angle
+        ]
+        best = max(candidates, key=lambda p: p["moment"], default=None)
+        if best is None or best["moment"] <= 0:
+            assert max_moment == 0.0
+            assert max_moment_angle == 0.0
+        else:
+            assert max_moment == pytest.approx(best["moment"])
+            assert max_moment_angle == pytest.approx(best["angle"])
+
 
 class TestCreateStabilityCurvePointsParameters:
     """Tests for different parameter combinations."""